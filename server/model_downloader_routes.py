@@ -5,10 +5,12 @@ Model download routes with recipe support and progress tracking.
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import json
 import logging
 import os
+import re
 import shutil
 import socket
 import stat
@@ -17,13 +19,16 @@ import sys
 import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from ipaddress import ip_address
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 from urllib.parse import urlparse
-from urllib.request import HTTPRedirectHandler, Request, build_opener
 
+import aiohttp
 from aiohttp import web
 
 import folder_paths
@@ -34,13 +39,14 @@ from .audit_logger import audit_logger
 from .route_utils import (
     basename,
     json_error,
+    json_response,
     parse_json_body,
     require_json,
     require_same_origin,
     require_auth,
     require_rate_limit,
 )
-from .model_search_api import search_all_platforms
+from .model_search_api import search_all_platforms, search_all_platforms_batch
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +57,21 @@ MAX_ITEMS = 50
 DOWNLOAD_TIMEOUT = int(os.environ.get("MJR_MODEL_DOWNLOAD_TIMEOUT", "3600"))
 DEFAULT_MAX_DOWNLOAD_BYTES = 1000 * 1024**3
 CHUNK_SIZE = 1024 * 1024
+# Hashing is batched into larger blocks and run on a worker thread.
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+# Files at least this large are fetched as parallel byte ranges when the host allows it.
+RANGED_MIN_BYTES = 256 * 1024 * 1024
+RANGED_PART_SIZE = 64 * 1024 * 1024
+RANGED_PARTS = 4
+# Progress is published at most every PROGRESS_INTERVAL_S or PROGRESS_INTERVAL_BYTES.
+PROGRESS_INTERVAL_S = 0.25
+PROGRESS_INTERVAL_BYTES = 256 * 1024 * 1024
+# Written pages are dropped from the OS page cache every PAGE_CACHE_DROP_BYTES (Linux).
+PAGE_CACHE_DROP_BYTES = 64 * 1024 * 1024
+# Interrupted single-stream downloads are resumed with a Range request this many times.
+DOWNLOAD_RETRIES = max(0, int(os.environ.get("MJR_MODEL_DOWNLOAD_RETRIES", "3")))
+# Number of files fetched concurrently within one download job.
+PARALLEL_DOWNLOADS = max(1, int(os.environ.get("MJR_PARALLEL_DOWNLOADS", "3")))
 
 VALID_KINDS = {
     "checkpoints",
@@ -75,6 +96,10 @@ KIND_ALIASES = {
     "diffusion": "diffusion_models",
 }
 
+# Every accepted spelling (canonical kinds and aliases) -> canonical kind.
+_KIND_NORMALIZE = MappingProxyType({**{k: k for k in VALID_KINDS}, **KIND_ALIASES})
+_BAD_FILENAME_CHARS = frozenset("/\\:")
+
 TYPE_HINT_KIND = {
     "checkpoint": "checkpoints",
     "diffusion": "diffusion_models",
@@ -92,8 +117,12 @@ TYPE_HINT_KIND = {
     "unknown": "",
 }
 
-_jobs: Dict[str, Dict[str, Any]] = {}
+# job_id -> {"lock": per-job lock guarding progress updates, "created_ts": float,
+# "data": job state}, in creation order. _jobs_lock only guards inserting and removing jobs.
+_jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 _jobs_lock = threading.Lock()
+# Strong references so running download tasks are not garbage collected.
+_download_tasks: set[asyncio.Task] = set()
 JOB_CLEANUP_HOURS = int(os.environ.get("MJR_JOB_CLEANUP_HOURS", "1"))
 # By default, allow overwriting existing files (set to "1" to skip if file exists)
 SKIP_EXISTING_FILES = str(os.environ.get("MJR_SKIP_EXISTING_FILES", "0")).strip().lower() in ("1", "true", "yes", "on")
@@ -119,6 +148,17 @@ DEFAULT_ALLOWED_HOSTS = {
 
 DEFAULT_BLOCK_PRIVATE_IPS = True
 
+# Online model searches block on HTTP; keep them off ComfyUI's default executor.
+_search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mjr-search")
+# Download file I/O (opens, chunk writes, closes) runs on its own threads rather than
+# the default executor, which every other to_thread caller in ComfyUI shares.
+_write_executor = ThreadPoolExecutor(
+    max_workers=PARALLEL_DOWNLOADS * RANGED_PARTS, thread_name_prefix="mjr-write"
+)
+
+_HEX64 = re.compile(r"[0-9a-f]{64}")
+_SPLIT_EXT = re.compile(r"\.[^.]*$")
+
 
 def _get_setting_bool(keys: tuple[str, ...], default: bool) -> bool:
     settings = _load_settings()
@@ -227,25 +267,78 @@ def _is_private_or_local_host(host: str) -> Tuple[bool, str]:
     return False, ""
 
 
-class _NoAuthCrossHostRedirects(HTTPRedirectHandler):
-    def redirect_request(self, req, fp, code, msg, headers, newurl):
-        newreq = super().redirect_request(req, fp, code, msg, headers, newurl)
-        if newreq is None:
-            return None
-        try:
-            old_host = urlparse(req.full_url).hostname or ""
-            new_host = urlparse(newreq.full_url).hostname or ""
-        except Exception:
-            old_host, new_host = "", ""
-        if old_host and new_host and old_host.lower() != new_host.lower():
-            if "Authorization" in newreq.headers:
-                del newreq.headers["Authorization"]
-        return newreq
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+
+async def _get_download_session() -> aiohttp.ClientSession:
+    """
+    Return the HTTP session shared by all download jobs, creating it on first use.
+
+    Reusing one connector keeps DNS entries and TLS connections alive between
+    jobs; limit_per_host bounds concurrent connections to any single host
+    across parallel items and ranged parts. aiohttp already drops the
+    Authorization header on cross-host redirects. The timeout mirrors the
+    previous per-socket timeout so large files are not cut off by a
+    total-duration limit.
+    """
+    global _session
+    async with _session_lock:
+        if _session is None or _session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=16, limit_per_host=4, ttl_dns_cache=300, keepalive_timeout=75
+            )
+            timeout = aiohttp.ClientTimeout(
+                total=None, sock_connect=DOWNLOAD_TIMEOUT, sock_read=DOWNLOAD_TIMEOUT
+            )
+            _session = aiohttp.ClientSession(
+                connector=connector, timeout=timeout, auto_decompress=False
+            )
+        return _session
+
 
+async def _close_download_session(app: web.Application) -> None:
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
 
-def _open_url(request: Request, timeout: int):
-    opener = build_opener(_NoAuthCrossHostRedirects())
-    return opener.open(request, timeout=timeout)
+
+def _is_cross_device(src: Path, dst_dir: Path) -> bool:
+    try:
+        return os.stat(src).st_dev != os.stat(dst_dir).st_dev
+    except OSError:
+        return False
+
+
+def _sendfile_copy(src: Path, dst: Path) -> bool:
+    """
+    Copy src to dst with os.sendfile so the data never passes through Python.
+
+    Only used on Linux, where sendfile accepts a regular file as destination.
+    Returns False (leaving no partial dst) if the copy could not be completed.
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "sendfile"):
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            remaining = os.fstat(src_fd).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(dst_fd, src_fd, offset, min(remaining, 1 << 30))
+                if sent == 0:
+                    raise OSError("sendfile made no progress")
+                offset += sent
+                remaining -= sent
+        return True
+    except OSError as e:
+        logger.debug("sendfile copy failed: %s", e)
+        try:
+            dst.unlink()
+        except Exception:
+            pass
+        return False
 
 
 def _aggressive_move_file(src: Path, dst: Path) -> Tuple[bool, Optional[str]]:
@@ -275,6 +368,14 @@ def _aggressive_move_file(src: Path, dst: Path) -> Tuple[bool, Optional[str]]:
     except Exception as e1:
         pass
 
+    # Strategy 1b: cross-filesystem kernel copy (Linux), then remove the source
+    if _is_cross_device(src, dst.parent) and _sendfile_copy(src, dst):
+        try:
+            src.unlink()
+        except Exception:
+            pass  # Source cleanup not critical
+        return True, None
+
     # Strategy 2: shutil.move
     try:
         shutil.move(src_str, dst_str)
@@ -372,8 +473,6 @@ def _sanitize_error_message(message: str, item: Dict[str, Any]) -> str:
 
     # Redact common patterns in URLs / headers.
     try:
-        import re
-
         msg = re.sub(r"(?i)(authorization:\\s*bearer\\s+)([^\\s]+)", r"\\1[REDACTED]", msg)
         msg = re.sub(r"(?i)(bearer\\s+)([^\\s]+)", r"\\1[REDACTED]", msg)
         msg = re.sub(r"(?i)(access_token|token|api_key|apikey|key)=([^&\\s]+)", r"\\1=[REDACTED]", msg)
@@ -384,21 +483,15 @@ def _sanitize_error_message(message: str, item: Dict[str, Any]) -> str:
 
 
 def _normalize_kind(kind: str) -> Optional[str]:
-    k = str(kind or "").strip().lower()
-    if k in KIND_ALIASES:
-        k = KIND_ALIASES[k]
-    if k in VALID_KINDS:
-        return k
-    return None
+    if not isinstance(kind, str):
+        kind = str(kind or "")
+    return _KIND_NORMALIZE.get(kind.strip().lower())
 
 
 def _is_valid_sha256(value: str) -> bool:
     if not value:
         return False
-    value = value.strip().lower()
-    if len(value) != 64:
-        return False
-    return all(c in "0123456789abcdef" for c in value)
+    return _HEX64.fullmatch(value.strip().lower()) is not None
 
 
 def _validate_url(url: str) -> Tuple[bool, str]:
@@ -464,7 +557,7 @@ def _extract_filename(url: str, filename: str) -> str:
 def _validate_filename(filename: str) -> Tuple[bool, str]:
     if not filename:
         return False, "filename is required"
-    if "/" in filename or "\\" in filename or ":" in filename:
+    if not _BAD_FILENAME_CHARS.isdisjoint(filename):
         return False, "filename must be a basename"
     if ".." in filename:
         return False, "filename contains invalid path"
@@ -496,14 +589,28 @@ def _settings_path() -> Path:
     return Path(folder_paths.get_user_directory()) / "default" / "comfy.settings.json"
 
 
+# (path, mtime_ns, parsed settings); reused until comfy.settings.json changes.
+_settings_cache: Optional[Tuple[Path, int, Dict[str, Any]]] = None
+
+
 def _load_settings() -> Dict[str, Any]:
+    global _settings_cache
     path = _settings_path()
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
         return {}
+    cached = _settings_cache
+    if cached and cached[0] == path and cached[1] == mtime:
+        return cached[2]
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        settings = json.loads(path.read_text(encoding="utf-8"))
     except Exception:
         return {}
+    if not isinstance(settings, dict):
+        settings = {}
+    _settings_cache = (path, mtime, settings)
+    return settings
 
 
 def _get_max_download_bytes() -> int:
@@ -545,26 +652,42 @@ def _get_max_download_bytes() -> int:
     return DEFAULT_MAX_DOWNLOAD_BYTES
 
 
-def _temp_dir(job_id: str) -> Path:
-    return _models_root() / ".mjr_tmp" / job_id
+def _temp_dir(job_id: str, target_dir: Path) -> Path:
+    # Keep temp files next to the target so the final move is a same-filesystem rename.
+    return target_dir / ".mjr_tmp" / job_id
 
 
-def _resolve_target_dir(kind: str) -> Optional[Path]:
+def _cleanup_temp_dirs(job_id: str, target_dirs: set[Path]) -> None:
+    for target_dir in target_dirs:
+        tmp_dir = _temp_dir(job_id, target_dir)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        try:
+            tmp_dir.parent.rmdir()
+        except OSError:
+            pass  # Other jobs still use it, or it never existed
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_target_dir_cached(kind: str) -> Optional[str]:
+    """
+    Resolve the folder a kind downloads into.
+
+    Cached because folder_paths is effectively static while the server runs;
+    call _resolve_target_dir_cached.cache_clear() after changing model paths.
+    """
     def select_path(paths: List[str], target: str) -> Optional[Path]:
         if not paths:
             return None
         target_lower = target.lower()
-        for path in paths:
-            if not path:
-                continue
-            if Path(path).name.lower() == target_lower:
-                return Path(path)
-        for path in paths:
-            if not path:
-                continue
-            norm = str(path).replace("\\", "/").lower()
+        candidates = [
+            (Path(path), str(path).replace("\\", "/").lower()) for path in paths if path
+        ]
+        for path, _ in candidates:
+            if path.name.lower() == target_lower:
+                return path
+        for path, norm in candidates:
             if f"/{target_lower}" in norm:
-                return Path(path)
+                return path
         return Path(paths[0])
 
     if kind == "clip":
@@ -574,77 +697,110 @@ def _resolve_target_dir(kind: str) -> Optional[Path]:
             paths = []
         selected = select_path(paths, "clip")
         if selected:
-            return selected
+            return str(selected)
     try:
         paths = folder_paths.get_folder_paths(kind)
     except Exception:
         paths = []
     selected = select_path(paths, kind)
     if selected:
-        return selected
+        return str(selected)
     root = _models_root()
     fallback = root / kind
     if fallback.exists():
-        return fallback
+        return str(fallback)
     if kind == "controlnet":
-        return root / "controlnet"
+        return str(root / "controlnet")
     if kind in VALID_KINDS:
-        return fallback
+        return str(fallback)
     return None
 
 
+def _resolve_target_dir(kind: str) -> Optional[Path]:
+    resolved = _resolve_target_dir_cached(kind)
+    return Path(resolved) if resolved else None
+
+
+def _build_kind_map(items: List[Dict[str, Any]]) -> Dict[str, Optional[Path]]:
+    """Resolve each distinct kind in a job to its target folder once."""
+    return {kind: _resolve_target_dir(kind) for kind in {item["kind"] for item in items}}
+
+
 def _init_job(job_id: str) -> None:
-    with _jobs_lock:
-        _jobs[job_id] = {
+    job = {
+        "lock": threading.Lock(),
+        "created_ts": time.time(),
+        "data": {
             "state": "queued",
             "progress": {"current": 0, "total": 0, "pct": 0},
+            "item_progress": {},
             "message": "",
             "created_at": datetime.now().isoformat(),
             "summary": {"downloaded": 0, "errors": 0, "skipped": 0},
-        }
+        },
+    }
+    with _jobs_lock:
+        _jobs[job_id] = job
 
 
 def _update_job(job_id: str, **kwargs) -> None:
-    with _jobs_lock:
-        job = _jobs.get(job_id)
-        if not job:
-            return
-        for key, value in kwargs.items():
-            job[key] = value
+    job = _jobs.get(job_id)
+    if not job:
+        return
+    with job["lock"]:
+        job["data"].update(kwargs)
+
+
+def _update_item_progress(job_id: str, key: str, current: int, total: int) -> None:
+    """Record progress for one item and refresh the aggregated job progress."""
+    job = _jobs.get(job_id)
+    if not job:
+        return
+    with job["lock"]:
+        data = job["data"]
+        item_progress = data["item_progress"]
+        item_progress[key] = (current, total)
+        agg_current = sum(c for c, _ in item_progress.values())
+        agg_total = sum(t for _, t in item_progress.values())
+        pct = int((agg_current / agg_total) * 100) if agg_total else 0
+        data["progress"] = {"current": agg_current, "total": agg_total, "pct": pct}
+
+
+class _ProgressThrottle:
+    """Gate progress updates so the read loops rarely touch shared job state."""
+
+    __slots__ = ("_next_bytes", "_next_time")
+
+    def __init__(self) -> None:
+        self._next_bytes = 0
+        self._next_time = 0.0
+
+    def due(self, downloaded: int) -> bool:
+        now = time.monotonic()
+        if downloaded < self._next_bytes and now < self._next_time:
+            return False
+        self._next_bytes = downloaded + PROGRESS_INTERVAL_BYTES
+        self._next_time = now + PROGRESS_INTERVAL_S
+        return True
 
 
 def _get_job(job_id: str) -> Optional[Dict[str, Any]]:
-    with _jobs_lock:
-        job = _jobs.get(job_id)
-        if not job:
-            return None
-        return dict(job)
+    job = _jobs.get(job_id)
+    if not job:
+        return None
+    with job["lock"]:
+        return dict(job["data"])
 
 
 def _cleanup_old_jobs() -> int:
     """Remove jobs older than JOB_CLEANUP_HOURS from memory. Returns count of removed jobs."""
-    from datetime import timedelta
-
-    now = datetime.now()
-    cutoff = now - timedelta(hours=JOB_CLEANUP_HOURS)
+    cutoff = time.time() - JOB_CLEANUP_HOURS * 3600
     removed = 0
 
     with _jobs_lock:
-        jobs_to_remove = []
-        for job_id, job in _jobs.items():
-            created_str = job.get("created_at", "")
-            if not created_str:
-                continue
-            try:
-                created = datetime.fromisoformat(created_str)
-                if created < cutoff:
-                    jobs_to_remove.append(job_id)
-            except (ValueError, TypeError):
-                # If we can't parse the date, keep the job to be safe
-                continue
-
-        for job_id in jobs_to_remove:
-            del _jobs[job_id]
+        # Jobs are kept in creation order, so expired ones are always at the front.
+        while _jobs and next(iter(_jobs.values()))["created_ts"] < cutoff:
+            _jobs.popitem(last=False)
             removed += 1
 
     if removed:
@@ -653,7 +809,7 @@ def _cleanup_old_jobs() -> int:
 
 
 def _prepare_headers(url: str, token: str | None) -> Dict[str, str]:
-    headers = {"User-Agent": "ComfyUI-Majoor-Downloader"}
+    headers = {"User-Agent": "ComfyUI-Majoor-Downloader", "Accept-Encoding": "identity"}
     if not token:
         token = (
             os.environ.get("HUGGINGFACE_HUB_TOKEN")
@@ -673,8 +829,384 @@ def _prepare_headers(url: str, token: str | None) -> Dict[str, str]:
     return headers
 
 
-def _download_single(
-    job_id: str, item: Dict[str, Any], index: int, total_items: int
+_FADV_DONTNEED = getattr(os, "POSIX_FADV_DONTNEED", None) if hasattr(os, "posix_fadvise") else None
+
+
+async def _run_write(fn: Any, *args: Any) -> Any:
+    return await asyncio.get_running_loop().run_in_executor(_write_executor, fn, *args)
+
+
+class _ChunkWriter:
+    """
+    Write download chunks to a file handle from a worker thread.
+
+    Where posix_fadvise is available, pages already written are periodically
+    dropped from the page cache so multi-GB downloads do not evict memory that
+    ComfyUI is actively using.
+    """
+
+    __slots__ = ("_handle", "_since_drop")
+
+    def __init__(self, handle: Any) -> None:
+        self._handle = handle
+        self._since_drop = 0
+
+    def write(self, chunk: bytes) -> None:
+        self._handle.write(chunk)
+        if _FADV_DONTNEED is None:
+            return
+        self._since_drop += len(chunk)
+        if self._since_drop >= PAGE_CACHE_DROP_BYTES:
+            self._since_drop = 0
+            try:
+                self._handle.flush()
+                os.posix_fadvise(self._handle.fileno(), 0, 0, _FADV_DONTNEED)
+            except OSError:
+                pass
+
+
+class _OverlappedHasher:
+    """
+    Feed a hashlib object from a worker thread so hashing overlaps network reads.
+
+    Chunks are batched into HASH_BLOCK_SIZE blocks; a bounded queue keeps at
+    most two blocks in flight between the reader and the hashing thread.
+    """
+
+    def __init__(self, hasher: Any, block_size: int = HASH_BLOCK_SIZE) -> None:
+        self._hasher = hasher
+        self._block_size = block_size
+        self._buf = bytearray()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mjr-hash")
+        self._worker = asyncio.create_task(self._consume())
+
+    async def _consume(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            block = await self._queue.get()
+            if block is None:
+                return
+            await loop.run_in_executor(self._pool, self._hasher.update, block)
+
+    def _take_block(self) -> memoryview:
+        # Hand the filled buffer over as-is and start a new one, so no copy is made
+        # and the worker never sees a buffer that is still being appended to.
+        block, self._buf = self._buf, bytearray()
+        return memoryview(block)
+
+    async def update(self, chunk: bytes) -> None:
+        self._buf += chunk
+        if len(self._buf) >= self._block_size:
+            await self._queue.put(self._take_block())
+
+    async def flush(self) -> None:
+        """Hash any buffered bytes and wait until the worker has caught up."""
+        if self._buf:
+            await self._queue.put(self._take_block())
+        await self._queue.put(None)
+        await self._worker
+
+    def close(self) -> None:
+        if not self._worker.done():
+            self._worker.cancel()
+        self._pool.shutdown(wait=False)
+
+
+class _ResumeRejected(Exception):
+    pass
+
+
+# Transient failures that leave a usable .part file behind.
+_RESUMABLE_ERRORS = (
+    aiohttp.ClientPayloadError,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+    _ResumeRejected,
+)
+
+
+def _hash_existing(hasher: Any, path: Path, block_size: int = 8 * 1024 * 1024) -> None:
+    with open(path, "rb") as handle:
+        while True:
+            block = handle.read(block_size)
+            if not block:
+                break
+            hasher.update(block)
+
+
+def _resume_validator(headers: Any) -> str:
+    """Strong ETag, else Last-Modified, usable as an If-Range value ("" if none)."""
+    etag = (headers.get("ETag") or "").strip()
+    if etag and not etag.startswith("W/"):
+        return etag
+    return (headers.get("Last-Modified") or "").strip()
+
+
+async def _download_stream(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    key: str,
+    url: str,
+    headers: Dict[str, str],
+    tmp_path: Path,
+    hasher: Optional[Any],
+    max_bytes: int,
+    resume_state: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Fetch url into tmp_path as a single sequential stream.
+
+    If tmp_path already holds bytes from an interrupted attempt, only the
+    remainder is requested and the existing bytes are fed to hasher first.
+    resume_state carries the ETag/Last-Modified of the first response across
+    attempts; it is sent as If-Range so a file changed on the server is sent
+    whole instead of being spliced. Without one the partial file is dropped.
+    """
+    if resume_state is None:
+        resume_state = {}
+    existing = tmp_path.stat().st_size if tmp_path.exists() else 0
+    if existing and not resume_state.get("validator"):
+        tmp_path.unlink(missing_ok=True)
+        existing = 0
+    if existing:
+        headers = {
+            **headers,
+            "Range": f"bytes={existing}-",
+            "If-Range": resume_state["validator"],
+        }
+    async with session.get(url, headers=headers) as resp:
+        if existing and resp.status == 416:
+            tmp_path.unlink(missing_ok=True)
+            raise _ResumeRejected("server rejected the resume range")
+        resp.raise_for_status()
+        # Re-validate final URL after redirects
+        try:
+            ok, err = await asyncio.to_thread(_validate_url, str(resp.url))
+            if not ok:
+                raise ValueError(f"redirected to disallowed url: {err}")
+        except Exception as e:
+            raise ValueError(f"invalid redirect: {e}")
+
+        if existing and resp.status == 206:
+            content_range = _parse_content_range(resp.headers.get("Content-Range"))
+            if content_range is None or content_range[0] != existing:
+                tmp_path.unlink(missing_ok=True)
+                raise _ResumeRejected("resume response starts at the wrong offset")
+        elif existing:
+            # Server ignored the range (or the file changed): start over.
+            existing = 0
+        if not existing:
+            resume_state["validator"] = _resume_validator(resp.headers)
+        total = resp.content_length or 0
+        if total:
+            total += existing
+        if total and max_bytes and total > max_bytes:
+            raise ValueError("download exceeds size limit")
+
+        if existing and hasher:
+            await asyncio.to_thread(_hash_existing, hasher, tmp_path)
+        handle = await _run_write(open, tmp_path, "ab" if existing else "wb")
+        try:
+            writer = _ChunkWriter(handle)
+            if hasher:
+                await _stream_with_hash(
+                    resp, writer, hasher, job_id, key, total, max_bytes, existing
+                )
+            else:
+                await _stream_plain(resp, writer, job_id, key, total, max_bytes, existing)
+        finally:
+            await _run_write(handle.close)
+
+
+async def _stream_plain(
+    resp: aiohttp.ClientResponse,
+    writer: _ChunkWriter,
+    job_id: str,
+    key: str,
+    total: int,
+    max_bytes: int,
+    downloaded: int = 0,
+) -> None:
+    throttle = _ProgressThrottle()
+    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+        await _run_write(writer.write, chunk)
+        downloaded += len(chunk)
+        if max_bytes and downloaded > max_bytes:
+            raise ValueError("download exceeds size limit")
+        if throttle.due(downloaded):
+            _update_item_progress(job_id, key, downloaded, total)
+    _update_item_progress(job_id, key, downloaded, total)
+
+
+async def _stream_with_hash(
+    resp: aiohttp.ClientResponse,
+    writer: _ChunkWriter,
+    hasher: Any,
+    job_id: str,
+    key: str,
+    total: int,
+    max_bytes: int,
+    downloaded: int = 0,
+) -> None:
+    throttle = _ProgressThrottle()
+    feeder = _OverlappedHasher(hasher)
+    try:
+        async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+            await _run_write(writer.write, chunk)
+            await feeder.update(chunk)
+            downloaded += len(chunk)
+            if max_bytes and downloaded > max_bytes:
+                raise ValueError("download exceeds size limit")
+            if throttle.due(downloaded):
+                _update_item_progress(job_id, key, downloaded, total)
+        _update_item_progress(job_id, key, downloaded, total)
+        await feeder.flush()
+    finally:
+        feeder.close()
+
+
+async def _probe_ranged(
+    session: aiohttp.ClientSession, url: str, headers: Dict[str, str]
+) -> Tuple[str, int]:
+    """
+    HEAD the url and return (final_url, size) if the host serves byte ranges.
+
+    Returns ("", 0) when ranges are unsupported or the probe fails, in which
+    case the caller falls back to a single stream.
+    """
+    try:
+        async with session.head(url, headers=headers, allow_redirects=True) as resp:
+            if resp.status != 200:
+                return "", 0
+            if (resp.headers.get("Accept-Ranges") or "").strip().lower() != "bytes":
+                return "", 0
+            return str(resp.url), resp.content_length or 0
+    except Exception:
+        return "", 0
+
+
+def _range_parts(total: int, part_size: int = RANGED_PART_SIZE):
+    for start in range(0, total, part_size):
+        yield start, min(start + part_size, total) - 1
+
+
+class _RangeNotSupported(Exception):
+    pass
+
+
+_CONTENT_RANGE_RE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+|\*)", re.IGNORECASE)
+
+
+def _parse_content_range(value: Optional[str]) -> Optional[Tuple[int, int, Optional[int]]]:
+    """Return (start, end, size) from a Content-Range header; size is None for "*"."""
+    match = _CONTENT_RANGE_RE.fullmatch((value or "").strip())
+    if not match:
+        return None
+    size = match.group(3)
+    return int(match.group(1)), int(match.group(2)), None if size == "*" else int(size)
+
+
+async def _download_ranged(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    key: str,
+    url: str,
+    headers: Dict[str, str],
+    tmp_path: Path,
+    total: int,
+    parts: int = RANGED_PARTS,
+) -> bool:
+    """
+    Fetch url into tmp_path as parallel byte ranges written at their offsets.
+
+    Returns False (with tmp_path removed) if the server ignores the Range
+    header, so the caller can fall back to a single stream.
+    """
+
+    def preallocate() -> None:
+        with open(tmp_path, "wb") as handle:
+            handle.truncate(total)
+
+    await _run_write(preallocate)
+    sem = asyncio.Semaphore(parts)
+    throttle = _ProgressThrottle()
+    downloaded = 0
+
+    async def fetch_part(start: int, end: int) -> None:
+        nonlocal downloaded
+        async with sem:
+            part_headers = {**headers, "Range": f"bytes={start}-{end}"}
+            async with session.get(url, headers=part_headers, allow_redirects=False) as resp:
+                if resp.status != 206:
+                    raise _RangeNotSupported(f"HTTP {resp.status}")
+                expected = end - start + 1
+                if resp.content_length is not None and resp.content_length != expected:
+                    raise ValueError("range response length mismatch")
+                content_range = _parse_content_range(resp.headers.get("Content-Range"))
+                if (
+                    content_range is None
+                    or content_range[:2] != (start, end)
+                    or content_range[2] not in (None, total)
+                ):
+                    raise ValueError("range response does not match the requested range")
+                # Each part owns its handle, so no file position is shared between tasks.
+                handle = await _run_write(open, tmp_path, "r+b")
+                try:
+                    await _run_write(handle.seek, start)
+                    writer = _ChunkWriter(handle)
+                    received = 0
+                    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                        received += len(chunk)
+                        if received > expected:
+                            raise ValueError("range response longer than requested")
+                        await _run_write(writer.write, chunk)
+                        downloaded += len(chunk)
+                        if throttle.due(downloaded):
+                            _update_item_progress(job_id, key, downloaded, total)
+                    if received != expected:
+                        raise ValueError("range response ended early")
+                finally:
+                    await _run_write(handle.close)
+
+    tasks = [asyncio.create_task(fetch_part(start, end)) for start, end in _range_parts(total)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException as e:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if isinstance(e, _RangeNotSupported):
+            logger.info("Ranged download not honoured for %s (%s), using single stream", key, e)
+            tmp_path.unlink(missing_ok=True)
+            _update_item_progress(job_id, key, 0, 0)
+            return False
+        raise
+    if downloaded != total:
+        raise ValueError("ranged download size mismatch")
+    _update_item_progress(job_id, key, downloaded, total)
+    return True
+
+
+def _sha256_file(path: Path, block_size: int = HASH_BLOCK_SIZE) -> str:
+    hasher = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while True:
+            block = handle.read(block_size)
+            if not block:
+                break
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+async def _download_single_async(
+    session: aiohttp.ClientSession,
+    job_id: str,
+    item: Dict[str, Any],
+    index: int,
+    total_items: int,
+    max_bytes: int,
+    kind_map: Dict[str, Optional[Path]],
 ) -> Dict[str, Any]:
     key = item["key"]
     url = item["url"]
@@ -682,7 +1214,7 @@ def _download_single(
     kind = item["kind"]
     sha256_expected = item.get("sha256")
 
-    target_dir = _resolve_target_dir(kind)
+    target_dir = kind_map.get(kind)
     if not target_dir:
         raise ValueError(f"no target folder for kind '{kind}'")
     target_dir.mkdir(parents=True, exist_ok=True)
@@ -731,7 +1263,7 @@ def _download_single(
             except Exception as e:
                 logger.warning(f"Could not remove existing file {target_path}: {e}. Will try to overwrite.")
 
-    tmp_dir = _temp_dir(job_id)
+    tmp_dir = _temp_dir(job_id, target_dir)
     tmp_dir.mkdir(parents=True, exist_ok=True)
     tmp_path = tmp_dir / f"{filename}.part"
     if tmp_path.exists():
@@ -742,51 +1274,53 @@ def _download_single(
 
     token = item.get("token") or ""
     headers = _prepare_headers(url, token)
-    request = Request(url, headers=headers)
-    total = 0
-    downloaded = 0
-    hasher = hashlib.sha256() if sha256_expected else None
+    hasher = None
 
     message = f"{index}/{total_items} downloading {filename}"
     _update_job(job_id, state="downloading", message=message)
-    max_bytes = _get_max_download_bytes()
 
+    ranged = False
     try:
-        with _open_url(request, timeout=DOWNLOAD_TIMEOUT) as resp:
-            # Re-validate final URL after redirects
-            try:
-                final = urlparse(resp.geturl())
-                ok, err = _validate_url(final.geturl())
-                if not ok:
-                    raise ValueError(f"redirected to disallowed url: {err}")
-            except Exception as e:
-                raise ValueError(f"invalid redirect: {e}")
-
-            length = resp.headers.get("Content-Length")
-            if length:
-                try:
-                    total = int(length)
-                except ValueError:
-                    total = 0
-            if total and max_bytes and total > max_bytes:
+        final_url, total = await _probe_ranged(session, url, headers)
+        if total >= RANGED_MIN_BYTES:
+            ok, err = await asyncio.to_thread(_validate_url, final_url)
+            if not ok:
+                raise ValueError(f"redirected to disallowed url: {err}")
+            if max_bytes and total > max_bytes:
                 raise ValueError("download exceeds size limit")
-
-            with open(tmp_path, "wb") as handle:
-                while True:
-                    chunk = resp.read(CHUNK_SIZE)
-                    if not chunk:
-                        break
-                    handle.write(chunk)
-                    if hasher:
-                        hasher.update(chunk)
-                    downloaded += len(chunk)
-                    if max_bytes and downloaded > max_bytes:
-                        raise ValueError("download exceeds size limit")
-                    pct = int((downloaded / total) * 100) if total else 0
-                    _update_job(
-                        job_id,
-                        progress={"current": downloaded, "total": total, "pct": pct},
-                    )
+            # The GETs below do not follow redirects, so drop the token ourselves when
+            # the probe ended on another host, as aiohttp does for redirects.
+            if urlparse(final_url).hostname == urlparse(url).hostname:
+                range_headers = headers
+            else:
+                range_headers = {k: v for k, v in headers.items() if k != "Authorization"}
+            ranged = await _download_ranged(
+                session, job_id, key, final_url, range_headers, tmp_path, total
+            )
+        attempt = 0
+        resume_state: Dict[str, str] = {}
+        while not ranged:
+            hasher = hashlib.sha256() if sha256_expected else None
+            try:
+                await _download_stream(
+                    session, job_id, key, url, headers, tmp_path, hasher, max_bytes,
+                    resume_state,
+                )
+                break
+            except _RESUMABLE_ERRORS as e:
+                if attempt >= DOWNLOAD_RETRIES:
+                    raise
+                attempt += 1
+                resume_at = tmp_path.stat().st_size if tmp_path.exists() else 0
+                logger.warning(
+                    "Download of %s interrupted (%s), resuming at %d bytes (%d/%d)",
+                    filename, e, resume_at, attempt, DOWNLOAD_RETRIES,
+                )
+                _update_job(
+                    job_id,
+                    message=f"{index}/{total_items} resuming {filename} ({attempt}/{DOWNLOAD_RETRIES})",
+                )
+                await asyncio.sleep(min(2**attempt, 10))
     except Exception:
         if tmp_path.exists():
             try:
@@ -795,27 +1329,26 @@ def _download_single(
                 pass
         raise
 
-    if sha256_expected and hasher:
-        digest = hasher.hexdigest()
+    if sha256_expected:
+        if ranged:
+            digest = await asyncio.to_thread(_sha256_file, tmp_path)
+        else:
+            digest = hasher.hexdigest()
         if digest.lower() != sha256_expected.lower():
             raise ValueError("sha256 mismatch")
 
-    # Move file to final destination with fallback strategies
-    final_tmp = tmp_dir / filename
+    # File moves may sleep between retries, keep them off the event loop.
+    await asyncio.to_thread(
+        _move_into_place, tmp_path, target_dir, target_path, filename
+    )
+    return {"key": key, "filename": filename, "status": "ok"}
 
-    # Step 1: Rename within temp dir (should always work)
-    try:
-        os.replace(tmp_path, final_tmp)
-    except (PermissionError, OSError) as e:
-        logger.warning("Failed to rename in temp dir: %s, trying copy", e)
-        try:
-            shutil.copy2(tmp_path, final_tmp)
-            tmp_path.unlink()
-        except Exception as e2:
-            logger.error("Failed to copy in temp dir: %s", e2)
-            raise ValueError(f"Failed to rename downloaded file: {e}")
 
-    # Step 2: Move to target directory with aggressive strategies including Windows APIs
+def _move_into_place(
+    tmp_path: Path, target_dir: Path, target_path: Path, filename: str
+) -> None:
+    # tmp_path lives under target_dir, so the first strategy (os.replace) is a single
+    # atomic rename; the others only matter when that is blocked (e.g. on Windows).
     move_success = False
     last_error = None
     max_retries = 3
@@ -828,7 +1361,7 @@ def _download_single(
             retry_delay *= 2  # Exponential backoff
 
         # Use aggressive move with all available methods
-        success, error_msg = _aggressive_move_file(final_tmp, target_path)
+        success, error_msg = _aggressive_move_file(tmp_path, target_path)
 
         if success:
             move_success = True
@@ -843,11 +1376,11 @@ def _download_single(
     if not move_success:
         # Don't cleanup temp file - let user manually move it
         temp_file_kept = False
-        if final_tmp.exists():
+        if tmp_path.exists():
             temp_file_kept = True
             logger.error(
                 f"File successfully downloaded but could not be moved to {target_path}. "
-                f"Downloaded file is kept at: {final_tmp}. "
+                f"Downloaded file is kept at: {tmp_path}. "
                 f"You can manually move this file to your models directory."
             )
 
@@ -867,7 +1400,7 @@ def _download_single(
 
             if temp_file_kept:
                 suggestions.append(
-                    f"7. Manually move the file from {final_tmp} to {target_path}"
+                    f"7. Manually move the file from {tmp_path} to {target_path}"
                 )
 
             error_detail = (
@@ -878,48 +1411,66 @@ def _download_single(
         else:
             error_detail = f"Failed to move file to destination: {last_error}"
             if temp_file_kept:
-                error_detail += f"\n\nFile kept at: {final_tmp}"
+                error_detail += f"\n\nFile kept at: {tmp_path}"
 
         raise ValueError(error_detail)
 
-    return {"key": key, "filename": filename, "status": "ok"}
 
-
-def _run_download_job(job_id: str, items: List[Dict[str, Any]]) -> None:
-    downloaded = 0
-    errors = 0
-    skipped = 0
-    results = []
-    total_items = len(items)
-
-    for index, item in enumerate(items, start=1):
+async def _download_item_bounded(
+    sem: asyncio.Semaphore,
+    session: aiohttp.ClientSession,
+    job_id: str,
+    item: Dict[str, Any],
+    index: int,
+    total_items: int,
+    max_bytes: int,
+    kind_map: Dict[str, Optional[Path]],
+) -> Dict[str, Any]:
+    async with sem:
         try:
-            result = _download_single(job_id, item, index, total_items)
-            results.append(result)
-            if result.get("status") == "ok":
-                downloaded += 1
-            elif result.get("status") == "skipped":
-                skipped += 1
+            return await _download_single_async(
+                session, job_id, item, index, total_items, max_bytes, kind_map
+            )
         except Exception as e:
             error_msg = _sanitize_error_message(str(e), item)
             logger.warning("Download failed for %s: %s", item.get("key"), error_msg)
-            results.append(
-                {
-                    "key": item.get("key", ""),
-                    "filename": item.get("filename", ""),
-                    "status": "error",
-                    "error": error_msg,
-                }
+            return {
+                "key": item.get("key", ""),
+                "filename": item.get("filename", ""),
+                "status": "error",
+                "error": error_msg,
+            }
+
+
+async def _run_download_job_async(job_id: str, items: List[Dict[str, Any]]) -> None:
+    total_items = len(items)
+    sem = asyncio.Semaphore(PARALLEL_DOWNLOADS)
+    max_bytes = await asyncio.to_thread(_get_max_download_bytes)
+    kind_map = _build_kind_map(items)
+
+    session = await _get_download_session()
+    results = await asyncio.gather(
+        *(
+            _download_item_bounded(
+                sem, session, job_id, item, index, total_items, max_bytes, kind_map
             )
-            errors += 1
+            for index, item in enumerate(items, start=1)
+        )
+    )
+
+    statuses = [r.get("status") for r in results]
+    downloaded = statuses.count("ok")
+    skipped = statuses.count("skipped")
+    errors = statuses.count("error")
 
     summary = {"downloaded": downloaded, "errors": errors, "skipped": skipped}
     state = "done" if errors == 0 else "error"
     message = f"Downloaded {downloaded}, skipped {skipped}, errors {errors}"
     _update_job(job_id, state=state, message=message, summary=summary)
 
+    target_dirs = {d for d in kind_map.values() if d}
     try:
-        shutil.rmtree(_temp_dir(job_id), ignore_errors=True)
+        await asyncio.to_thread(_cleanup_temp_dirs, job_id, target_dirs)
     except Exception:
         pass
 
@@ -961,6 +1512,42 @@ def _validate_item(raw: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
     )
 
 
+try:
+    PromptServer.instance.app.on_cleanup.append(_close_download_session)
+except Exception as exc:
+    logger.debug("Could not register download session cleanup: %s", exc)
+
+
+def _validate_items(raw_items: List[Any]) -> Tuple[List[Dict[str, Any]], str]:
+    """
+    Validate a batch of raw items, stopping at the first error.
+
+    Items with a duplicate key, or writing the same file as an earlier item
+    (e.g. legacy "clip" and "text_encoders"), keep their first occurrence:
+    items download in parallel and would otherwise share one .part file.
+    """
+    if not all(isinstance(raw, dict) for raw in raw_items):
+        return [], "invalid item in items"
+    unique: Dict[str, Dict[str, Any]] = {}
+    targets = set()
+    for raw in raw_items:
+        item, err = _validate_item(raw)
+        if err:
+            return [], err
+        if item["key"] in unique:
+            continue
+        # Casefolded, since model folders may live on case-insensitive filesystems.
+        target = (
+            str(_resolve_target_dir(item["kind"])).casefold(),
+            item["filename"].casefold(),
+        )
+        if target in targets:
+            continue
+        targets.add(target)
+        unique[item["key"]] = item
+    return list(unique.values()), ""
+
+
 @PromptServer.instance.routes.post("/mjr_models/resolve_recipes")
 async def mjr_models_resolve_recipes(request: web.Request) -> web.Response:
     """Resolve missing models against recipe database with optional auto-search."""
@@ -992,8 +1579,8 @@ async def mjr_models_resolve_recipes(request: web.Request) -> web.Response:
 
     # If auto_search is enabled, search online for models without recipes
     if auto_search:
-        loop = asyncio.get_running_loop()
-        for entry, missing in zip(resolved, raw_missing):
+        pending = []
+        for entry in resolved:
             if entry.get("recipe"):
                 continue
 
@@ -1006,22 +1593,23 @@ async def mjr_models_resolve_recipes(request: web.Request) -> web.Response:
             key = entry.get("key", "")
             if key:
                 # Remove extension for better search
-                search_query = key.rsplit(".", 1)[0]
-
-                # Search online
-                search_results = await loop.run_in_executor(
-                    None, search_all_platforms, search_query, 1
-                )
-
-                # Use first result if available
-                all_results = []
-                for platform_results in search_results.get("platforms", {}).values():
-                    all_results.extend(platform_results)
+                pending.append((entry, _SPLIT_EXT.sub("", key)))
 
-                if all_results:
-                    best_result = all_results[0]
-                    entry["auto_search_result"] = best_result
-                    entry["kind"] = best_result.get("type", "")
+        # One batched call searches all entries concurrently (duplicates once).
+        loop = asyncio.get_running_loop()
+        outcomes = await loop.run_in_executor(
+            _search_executor, search_all_platforms_batch, [q for _, q in pending], 1
+        )
+        for (entry, _), search_results in zip(pending, outcomes):
+            # Use first result if available
+            all_results = []
+            for platform_results in search_results.get("platforms", {}).values():
+                all_results.extend(platform_results)
+
+            if all_results:
+                best_result = all_results[0]
+                entry["auto_search_result"] = best_result
+                entry["kind"] = best_result.get("type", "")
     else:
         for entry, missing in zip(resolved, raw_missing):
             if entry.get("recipe"):
@@ -1030,7 +1618,7 @@ async def mjr_models_resolve_recipes(request: web.Request) -> web.Response:
             kind = TYPE_HINT_KIND.get(hint, "")
             entry["kind"] = kind
 
-    return web.json_response({"ok": True, "resolved": resolved})
+    return json_response({"ok": True, "resolved": resolved})
 
 
 @PromptServer.instance.routes.post("/mjr_models/save_recipes")
@@ -1076,7 +1664,7 @@ async def mjr_models_save_recipes(request: web.Request) -> web.Response:
         details={"count": len(items)},
         success=True,
     )
-    return web.json_response({"ok": True})
+    return json_response({"ok": True})
 
 
 @PromptServer.instance.routes.post("/mjr_models/download")
@@ -1104,18 +1692,10 @@ async def mjr_models_download(request: web.Request) -> web.Response:
     if len(raw_items) > MAX_ITEMS:
         return json_error("too many items")
 
-    items = []
-    seen = set()
-    for raw in raw_items:
-        if not isinstance(raw, dict):
-            return json_error("invalid item in items")
-        item, err = _validate_item(raw)
-        if err:
-            return json_error(err)
-        if item["key"] in seen:
-            continue
-        seen.add(item["key"])
-        items.append(item)
+    # URL validation may resolve hostnames (SSRF guard), so keep it off the event loop.
+    items, err = await asyncio.to_thread(_validate_items, raw_items)
+    if err:
+        return json_error(err)
 
     # Clean up old jobs before creating new one
     _cleanup_old_jobs()
@@ -1123,8 +1703,9 @@ async def mjr_models_download(request: web.Request) -> web.Response:
     job_id = uuid.uuid4().hex
     _init_job(job_id)
 
-    loop = asyncio.get_running_loop()
-    loop.run_in_executor(None, _run_download_job, job_id, items)
+    task = asyncio.create_task(_run_download_job_async(job_id, items))
+    _download_tasks.add(task)
+    task.add_done_callback(_download_tasks.discard)
 
     audit_logger.log_event(
         request,
@@ -1133,7 +1714,7 @@ async def mjr_models_download(request: web.Request) -> web.Response:
         details={"count": len(items)},
         success=True,
     )
-    return web.json_response({"ok": True, "job_id": job_id})
+    return json_response({"ok": True, "job_id": job_id})
 
 
 @PromptServer.instance.routes.get("/mjr_models/download_status")
@@ -1153,7 +1734,7 @@ async def mjr_models_download_status(request: web.Request) -> web.Response:
     if not job:
         return json_error("job not found", status=404)
 
-    return web.json_response(
+    return json_response(
         {
             "ok": True,
             "state": job.get("state", "queued"),
@@ -1201,7 +1782,7 @@ async def mjr_models_search_online(request: web.Request) -> web.Response:
     # Run search in thread pool to avoid blocking
     loop = asyncio.get_running_loop()
     try:
-        results = await loop.run_in_executor(None, search_all_platforms, query, limit)
+        results = await loop.run_in_executor(_search_executor, search_all_platforms, query, limit)
     except Exception as exc:
         logger.error("Model search failed: %s", exc)
         return json_error("search failed, check logs", status=500)
@@ -1213,4 +1794,4 @@ async def mjr_models_search_online(request: web.Request) -> web.Response:
         details={"query_len": len(query), "limit": int(limit)},
         success=True,
     )
-    return web.json_response({"ok": True, "results": results})
+    return json_response({"ok": True, "results": results})
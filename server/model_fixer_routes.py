@@ -5,18 +5,30 @@ Model fixer routes for missing model repair and fingerprint cache.
 from __future__ import annotations
 
 import asyncio
+import errno
 import hashlib
 import logging
 import os
 import re
+import shutil
 import threading
-from datetime import datetime
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 
 from aiohttp import web
 
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    from rapidfuzz import process as _rf_process
+except ImportError:  # Optional speedup; difflib is used when it is missing.
+    _rf_fuzz = None
+    _rf_process = None
+
 import folder_paths
 from server import PromptServer
 
@@ -26,6 +38,7 @@ from .audit_logger import audit_logger
 from .route_utils import (
     basename,
     json_error,
+    json_response,
     parse_json_body,
     require_json,
     require_same_origin,
@@ -38,14 +51,24 @@ logger = logging.getLogger(__name__)
 # Lock to prevent concurrent fingerprint cache builds
 _fingerprint_cache_lock = threading.Lock()
 
+# (cache file mtime_ns, snapshot) backing fingerprint status and resolve requests
+_fingerprint_snapshot: Tuple[int, Dict[str, Any]] | None = None
+
 MAX_MISSING = 200
 MAX_CANDIDATES = 10
-FINGERPRINT_SCHEMA = 1
+FINGERPRINT_SCHEMA = 2
+HASH_BLOCK_SIZE = 4 * 1024 * 1024
+FINGERPRINT_WORKERS = min(8, os.cpu_count() or 1)
 
 # Stopwords and patterns for candidate scoring
-_STOPWORDS = {"model", "checkpoint", "ckpt", "lora", "vae", "clip", "unet", "diffusion", "stable", "sd", "comfyui"}
-_EXT_RE = re.compile(r"\.(safetensors|ckpt|pt|pth|bin)$", re.IGNORECASE)
-_BRACKETS_RE = re.compile(r"[\[\(\{].*?[\]\)\}]", re.IGNORECASE)
+_STOPWORDS = frozenset(
+    {"model", "checkpoint", "ckpt", "lora", "vae", "clip", "unet", "diffusion", "stable", "sd", "comfyui"}
+)
+# Trailing model extension or a bracketed group, stripped in a single pass.
+# Applied to lowercased names, so the pattern is case-sensitive.
+_EXT_OR_BRACKETS_RE = re.compile(r"\.(?:safetensors|ckpt|pt|pth|bin)$|[\[\(\{].*?[\]\)\}]")
+# Any run of separators/punctuation/whitespace collapses to one space
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
 
 ALL_MODEL_KINDS = [
     "checkpoints",
@@ -76,21 +99,14 @@ def _is_safe_relpath(value: str) -> bool:
 
 
 def _basename_no_ext(value: str) -> str:
-    base = basename(value)
-    if "." in base:
-        return base.rsplit(".", 1)[0]
-    return base
+    return os.path.splitext(basename(value))[0]
 
 
+@lru_cache(maxsize=65536)
 def _normalize_for_match(value: str) -> str:
     """Normalize a model name for matching by removing extensions, brackets, and special characters."""
-    s = basename(value).lower()
-    s = _EXT_RE.sub("", s)
-    s = _BRACKETS_RE.sub(" ", s)
-    s = re.sub(r"[-_\.]+", " ", s)
-    s = re.sub(r"[^a-z0-9 ]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    s = _EXT_OR_BRACKETS_RE.sub(" ", basename(value).lower())
+    return _NON_ALNUM_RE.sub(" ", s).strip()
 
 
 def _list_kind_files(kind: str) -> List[str]:
@@ -101,6 +117,161 @@ def _list_kind_files(kind: str) -> List[str]:
         return []
 
 
+def _fuzzy_ratio(a: str, b: str) -> float:
+    """Similarity ratio in [0, 1], computed by RapidFuzz when it is installed."""
+    if _rf_fuzz is not None:
+        return _rf_fuzz.ratio(a, b) / 100.0
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def _batch_fuzzy_ratios(queries: List[str], choices: List[str]) -> Any:
+    """
+    Ratios (0-100) for every query/choice pair in one RapidFuzz cdist call.
+
+    Returns None when RapidFuzz (or the numpy it needs for cdist) is unavailable,
+    in which case callers score pairs one at a time.
+    """
+    if _rf_process is None or not queries or not choices:
+        return None
+    try:
+        return _rf_process.cdist(queries, choices, scorer=_rf_fuzz.ratio, workers=-1)
+    except ImportError:
+        return None
+
+
+def _match_tokens(norm: str) -> frozenset:
+    """Meaningful tokens of a normalized name (stopwords and single characters dropped)."""
+    stopwords = _STOPWORDS
+    return frozenset([w for w in norm.split() if len(w) > 1 and w not in stopwords])
+
+
+class _CandidateIndex:
+    """
+    Per-kind lookups that shortlist the candidates worth scoring for a query.
+
+    Kept: candidates sharing a meaningful token with the query (inverted index),
+    tokenless candidates (fuzzy fallback), and candidates whose normalized name
+    contains, or is contained in, the query's. Skipped candidates could only
+    score through the fuzzy ratio (30 points at most) and are not returned.
+
+    Containment runs without a Python-level pass over the kind: one str.find
+    sweep over all names joined by newlines (normalized names never contain
+    one), and dict probes for the query's slices at the lengths candidates
+    have, which costs O(len(query) ** 2) at worst, whatever the kind's size.
+    """
+
+    __slots__ = (
+        "_size", "_postings", "_tokenless", "_joined", "_starts", "_by_norm", "_lengths"
+    )
+
+    def __init__(self, entries: List[Tuple[str, str, str, frozenset]]) -> None:
+        postings: Dict[str, List[int]] = {}
+        tokenless: List[int] = []
+        by_norm: Dict[str, List[int]] = {}
+        starts: List[int] = []
+        offset = 0
+        for i, (_relpath, _cand_base, cand_norm, cand_tokens) in enumerate(entries):
+            if not cand_tokens:
+                tokenless.append(i)
+            for token in cand_tokens:
+                postings.setdefault(token, []).append(i)
+            by_norm.setdefault(cand_norm, []).append(i)
+            starts.append(offset)
+            offset += len(cand_norm) + 1
+        self._size = len(entries)
+        self._postings = postings
+        self._tokenless = tokenless
+        self._joined = "\n".join(entry[2] for entry in entries)
+        self._starts = starts
+        self._by_norm = by_norm
+        self._lengths = sorted({len(norm) for norm in by_norm})
+
+    def _containing(self, base_norm: str) -> Iterator[int]:
+        """Positions whose name contains base_norm (which must be non-empty)."""
+        joined, starts = self._joined, self._starts
+        pos = joined.find(base_norm)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            yield i
+            if i + 1 == len(starts):
+                return
+            pos = joined.find(base_norm, starts[i + 1])
+
+    def _contained(self, base_norm: str) -> Iterator[int]:
+        """Positions whose name is a substring of base_norm."""
+        n = len(base_norm)
+        for length in self._lengths:
+            if length > n:
+                return
+            for piece in {base_norm[i:i + length] for i in range(n - length + 1)}:
+                yield from self._by_norm.get(piece, ())
+
+    def shortlist(self, base_norm: str, base_tokens: frozenset) -> Iterable[int]:
+        """Candidate positions worth scoring for a query, in their original order."""
+        if not base_tokens:
+            return range(self._size)
+        ids = set(self._tokenless)
+        for token in base_tokens:
+            ids.update(self._postings.get(token, ()))
+        ids.update(self._containing(base_norm))
+        ids.update(self._contained(base_norm))
+        return sorted(ids)
+
+
+# Folders never scanned: what folder_paths excludes, plus in-progress downloads.
+_SKIPPED_DIR_NAMES = frozenset({".git", ".mjr_tmp"})
+
+
+def _scan_kind(kind: str) -> Iterator[Tuple[str, str, int, float]]:
+    """
+    Walk the folders of a model kind with os.scandir.
+
+    Yields (relpath, full_path, size, mtime) using the DirEntry stat, so the
+    builder does not need a get_full_path lookup and a second stat per file.
+    Mirrors folder_paths: legacy kinds ("clip", "unet") are mapped, its extension
+    filter applies, only .git is skipped (plus our .mjr_tmp download dirs), and
+    the first folder wins for duplicate relpaths.
+    """
+    try:
+        map_legacy = getattr(folder_paths, "map_legacy", None)
+        folder_name = map_legacy(kind) if map_legacy else kind
+        roots = list(folder_paths.get_folder_paths(folder_name))
+        extensions = folder_paths.folder_names_and_paths[folder_name][1]
+    except Exception as e:
+        logger.warning("Failed to list models for kind '%s': %s", kind, e)
+        return
+
+    seen = set()
+    for root in roots:
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                if current != root:
+                    logger.warning("Failed to scan %s: %s", current, e)
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if entry.name not in _SKIPPED_DIR_NAMES:
+                            stack.append(entry.path)
+                        continue
+                    if extensions and os.path.splitext(entry.name)[1].lower() not in extensions:
+                        continue
+                    relpath = os.path.relpath(entry.path, root)
+                    if relpath in seen:
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.warning("Failed to stat %s: %s", entry.path, e)
+                    continue
+                seen.add(relpath)
+                yield relpath, entry.path, int(stat.st_size), float(stat.st_mtime)
+
+
 def _candidate_score(base: str, candidate: str) -> Tuple[int, str]:
     """
     Improved scoring using token-based overlap, fuzzy matching, and normalization.
@@ -108,14 +279,31 @@ def _candidate_score(base: str, candidate: str) -> Tuple[int, str]:
     Returns:
         Tuple of (score 0-100, reason string)
     """
+    base_norm = _normalize_for_match(base)
+    cand_norm = _normalize_for_match(candidate)
+    return _score_pretoken(
+        base, base_norm, _match_tokens(base_norm), candidate, cand_norm, _match_tokens(cand_norm)
+    )
+
+
+def _score_pretoken(
+    base: str,
+    base_norm: str,
+    base_tokens: frozenset,
+    candidate: str,
+    cand_norm: str,
+    cand_tokens: frozenset,
+    fuzzy_ratio: float | None = None,
+) -> Tuple[int, str]:
+    """
+    Score with normalized forms and tokens already computed by the caller.
+
+    fuzzy_ratio may carry a precomputed ratio of base_norm vs cand_norm in [0, 1].
+    """
     # Exact match on original strings is the highest score
     if base and candidate and base == candidate:
         return 100, "exact_basename"
 
-    # Normalize both strings for robust comparison
-    base_norm = _normalize_for_match(base)
-    cand_norm = _normalize_for_match(candidate)
-    
     # Don't match if the query is too short and non-specific
     if len(base_norm) < 4:
         return 0, "query_too_short"
@@ -124,14 +312,11 @@ def _candidate_score(base: str, candidate: str) -> Tuple[int, str]:
     if base_norm == cand_norm:
         return 100, "exact_normalized"
 
-    # Tokenize and filter stopwords for smarter matching
-    base_tokens = set(w for w in base_norm.split() if w not in _STOPWORDS and len(w) > 1)
-    cand_tokens = set(w for w in cand_norm.split() if w not in _STOPWORDS and len(w) > 1)
-
     # If no meaningful tokens, fall back to simple fuzzy matching
     if not base_tokens or not cand_tokens:
-        ratio = SequenceMatcher(None, base_norm, cand_norm).ratio()
-        return int(ratio * 80), "fuzzy_fallback" # Scale to 80 to leave room for better matches
+        if fuzzy_ratio is None:
+            fuzzy_ratio = _fuzzy_ratio(base_norm, cand_norm)
+        return int(fuzzy_ratio * 80), "fuzzy_fallback" # Scale to 80 to leave room for better matches
 
     # Token subset scoring (very strong signal)
     # If all query tokens are in the candidate, it's a great match.
@@ -146,8 +331,15 @@ def _candidate_score(base: str, candidate: str) -> Tuple[int, str]:
     union = len(base_tokens | cand_tokens)
     jaccard = intersection / union if union > 0 else 0
 
+    # Token overlap is conclusive at both ends; the fuzzy ratio only refines the middle band
+    if jaccard >= 0.8:
+        return int(min(jaccard * 100, 95)), "high_jaccard"
+    if jaccard == 0 and not (base_norm in cand_norm or cand_norm in base_norm):
+        return 0, "no_overlap"
+
     # Fuzzy matching on normalized strings (good for typos)
-    fuzzy_ratio = SequenceMatcher(None, base_norm, cand_norm).ratio()
+    if fuzzy_ratio is None:
+        fuzzy_ratio = _fuzzy_ratio(base_norm, cand_norm)
 
     # Substring bonus (rewards partial but contiguous matches)
     substring_bonus = 0
@@ -183,18 +375,59 @@ def _load_fingerprint_cache() -> Dict[str, Any]:
     }
 
 
+def _get_fingerprint_snapshot() -> Dict[str, Any]:
+    """
+    In-memory view of the fingerprint cache file, re-read only when its mtime changes.
+
+    Holds the item count, updated_at, and a {(kind, fingerprint): relpath} index so
+    status and resolve requests do not parse the whole JSON file each time.
+    """
+    global _fingerprint_snapshot
+    try:
+        mtime_ns = _fingerprint_cache_path().stat().st_mtime_ns
+    except OSError:
+        return {"count": 0, "updated_at": "", "index": {}}
+    cached = _fingerprint_snapshot
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    cache = _load_fingerprint_cache()
+    items = cache.get("items") or []
+    index: Dict[Tuple[str, str], Any] = {}
+    for item in items:
+        kind = item.get("kind")
+        fingerprint = item.get("fingerprint")
+        if isinstance(kind, str) and isinstance(fingerprint, str):
+            # First entry wins, as with the previous linear scan
+            index.setdefault((kind, fingerprint), item.get("relpath"))
+    snapshot = {"count": len(items), "updated_at": cache.get("updated_at", ""), "index": index}
+    _fingerprint_snapshot = (mtime_ns, snapshot)
+    return snapshot
+
+
+def _get_fingerprint_index() -> Dict[Tuple[str, str], Any]:
+    """Map (kind, fingerprint) to relpath."""
+    return _get_fingerprint_snapshot()["index"]
+
+
 def _hash_file(path: Path) -> str:
+    """Full-file SHA-256 with the size appended, so equal content always matches."""
     size = path.stat().st_size
-    hash_obj = hashlib.sha256()
     with path.open("rb") as handle:
-        if size < 2 * 1024 * 1024:
-            hash_obj.update(handle.read())
+        # Plain reads, not mmap: a file truncated while being hashed must raise
+        # OSError rather than SIGBUS the whole process.
+        if hasattr(hashlib, "file_digest"):
+            hash_obj = hashlib.file_digest(handle, "sha256")
         else:
-            head = handle.read(1024 * 1024)
-            hash_obj.update(head)
-            if size > 1024 * 1024:
-                handle.seek(max(size - 1024 * 1024, 0))
-                hash_obj.update(handle.read(1024 * 1024))
+            # Python 3.10: reuse one buffer instead of allocating per read
+            hash_obj = hashlib.sha256()
+            buf = bytearray(HASH_BLOCK_SIZE)
+            view = memoryview(buf)
+            while True:
+                read = handle.readinto(buf)
+                if not read:
+                    break
+                hash_obj.update(view[:read])
     hash_obj.update(str(size).encode("ascii"))
     return hash_obj.hexdigest()
 
@@ -204,6 +437,7 @@ def _build_fingerprint_cache(kinds: Iterable[str], force: bool) -> Dict[str, Any
     Build fingerprint cache with thread safety.
     Uses a lock to prevent concurrent cache builds that could conflict.
     """
+    global _fingerprint_snapshot
     with _fingerprint_cache_lock:
         cache = _load_fingerprint_cache()
         existing: Dict[Tuple[str, str], Dict[str, Any]] = {}
@@ -213,59 +447,59 @@ def _build_fingerprint_cache(kinds: Iterable[str], force: bool) -> Dict[str, Any
             if isinstance(kind, str) and isinstance(relpath, str):
                 existing[(kind, relpath)] = item
 
+        def hash_one(entry: Tuple[str, str, str, int, float]) -> Tuple[Dict[str, Any], bool] | None:
+            kind, relpath, full_path, size, mtime = entry
+            prev = existing.get((kind, relpath))
+            if (
+                not force
+                and prev
+                and prev.get("size") == size
+                and prev.get("mtime") == mtime
+                and prev.get("fingerprint")
+            ):
+                fingerprint = prev.get("fingerprint")
+                was_hashed = False
+            else:
+                try:
+                    fingerprint = _hash_file(Path(full_path))
+                except Exception as e:
+                    logger.warning("Failed to hash %s: %s", full_path, e)
+                    return None
+                was_hashed = True
+
+            item = {
+                "kind": kind,
+                "relpath": relpath,
+                "size": size,
+                "mtime": mtime,
+                "fingerprint": fingerprint,
+            }
+            return item, was_hashed
+
+        entries = [(kind, *scanned) for kind in kinds for scanned in _scan_kind(kind)]
+        total = len(entries)
+
+        # hashlib releases the GIL while digesting, so reads and hashing overlap across threads
         items = []
         hashed = 0
         reused = 0
-        total = 0
-
-        for kind in kinds:
-            for relpath in _list_kind_files(kind):
-                total += 1
-                full_path = folder_paths.get_full_path(kind, relpath)
-                if not full_path:
-                    continue
-                try:
-                    stat = os.stat(full_path)
-                    size = int(stat.st_size)
-                    mtime = float(stat.st_mtime)
-                except Exception as e:
-                    logger.warning("Failed to stat %s: %s", full_path, e)
+        with ThreadPoolExecutor(max_workers=FINGERPRINT_WORKERS, thread_name_prefix="mjr-fingerprint") as pool:
+            for result in pool.map(hash_one, entries):
+                if result is None:
                     continue
-
-                key = (kind, relpath)
-                prev = existing.get(key)
-                if (
-                    not force
-                    and prev
-                    and prev.get("size") == size
-                    and prev.get("mtime") == mtime
-                    and prev.get("fingerprint")
-                ):
-                    fingerprint = prev.get("fingerprint")
-                    reused += 1
-                else:
-                    try:
-                        fingerprint = _hash_file(Path(full_path))
-                    except Exception as e:
-                        logger.warning("Failed to hash %s: %s", full_path, e)
-                        continue
+                item, was_hashed = result
+                items.append(item)
+                if was_hashed:
                     hashed += 1
+                else:
+                    reused += 1
 
-                items.append(
-                    {
-                        "kind": kind,
-                        "relpath": relpath,
-                        "size": size,
-                        "mtime": mtime,
-                        "fingerprint": fingerprint,
-                    }
-                )
-
-        updated_at = datetime.now().isoformat()
+        updated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
         payload = {"schema": FINGERPRINT_SCHEMA, "updated_at": updated_at, "items": items}
         path = _fingerprint_cache_path()
         path.parent.mkdir(parents=True, exist_ok=True)
         write_json_atomic(path, payload)
+        _fingerprint_snapshot = None
         return {
             "count": len(items),
             "hashed": hashed,
@@ -275,42 +509,63 @@ def _build_fingerprint_cache(kinds: Iterable[str], force: bool) -> Dict[str, Any
         }
 
 
-@PromptServer.instance.routes.post("/mjr_models/scan_candidates")
-async def mjr_models_scan_candidates(request: web.Request) -> web.Response:
-    """Scan for candidate model files that match missing models."""
-    auth_error = require_auth(request)
-    if auth_error:
-        return auth_error
-    rate_error = require_rate_limit(request, "models_search")
-    if rate_error:
-        return rate_error
-    origin_error = require_same_origin(request)
-    if origin_error:
-        return origin_error
-    if not require_json(request):
-        return json_error("Content-Type must be application/json", status=415)
-
-    body, error = await parse_json_body(request)
-    if error:
-        return error
-
-    raw_missing = body.get("missing")
-    if not isinstance(raw_missing, list):
-        return json_error("missing must be a list")
-    if len(raw_missing) > MAX_MISSING:
-        return json_error(f"missing exceeds limit ({MAX_MISSING})")
+def _move_model_file(src: Path, dst: Path) -> None:
+    """
+    Move a model file, renaming in place when both paths share a filesystem.
 
-    kinds_cache: Dict[str, List[str]] = {}
+    Across devices the data is copied to a temp sibling with shutil.copyfile
+    (sendfile-backed on Linux), timestamps are carried over so the fingerprint
+    cache can reuse the entry, and the copy is swapped in with os.replace
+    before the source is removed.
+    """
+    try:
+        os.rename(src, dst)
+        return
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
 
-    def get_kind_list(kind: str) -> List[str]:
-        if kind not in kinds_cache:
-            kinds_cache[kind] = _list_kind_files(kind)
-        return kinds_cache[kind]
+    tmp = dst.with_name(f".{dst.name}.moving")
+    try:
+        shutil.copyfile(src, tmp)
+        stat = os.stat(src)
+        os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(tmp, dst)
+    except Exception:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    os.unlink(src)
+
+
+def _scan_candidates(raw_missing: List[Any]) -> List[Dict[str, Any]]:
+    """Rank installed model files against each missing entry (runs in a worker thread)."""
+    # Normalize and tokenize each candidate once per request instead of once per missing entry
+    kinds_norm_cache: Dict[str, List[Tuple[str, str, str, frozenset]]] = {}
+
+    def get_kind_list(kind: str) -> List[Tuple[str, str, str, frozenset]]:
+        if kind not in kinds_norm_cache:
+            entries = []
+            # Unique relpaths per kind, so the per-query loop needs no seen-set
+            for relpath in dict.fromkeys(_list_kind_files(kind)):
+                cand_norm = _normalize_for_match(relpath)
+                entries.append((relpath, basename(relpath), cand_norm, _match_tokens(cand_norm)))
+            kinds_norm_cache[kind] = entries
+        return kinds_norm_cache[kind]
+
+    index_cache: Dict[str, _CandidateIndex] = {}
+
+    def get_kind_index(kind: str) -> _CandidateIndex:
+        if kind not in index_cache:
+            index_cache[kind] = _CandidateIndex(get_kind_list(kind))
+        return index_cache[kind]
 
     # Import TYPE_HINT_KIND from model_downloader_routes
     from .model_downloader_routes import TYPE_HINT_KIND
 
-    results = []
+    queries = []
     for entry in raw_missing:
         missing_value = str((entry or {}).get("missing_value") or "").strip()
         type_hint = str((entry or {}).get("type_hint") or "unknown").strip().lower()
@@ -318,29 +573,48 @@ async def mjr_models_scan_candidates(request: web.Request) -> web.Response:
         expected_kind = str((entry or {}).get("expected_kind") or "").strip()
         if not expected_kind and type_hint:
             expected_kind = TYPE_HINT_KIND.get(type_hint, "")
+        base = basename(missing_value)
+        base_norm = _normalize_for_match(base) if missing_value else ""
+        queries.append((missing_value, type_hint, expected_kind, base, base_norm))
+
+    # One many-to-many ratio matrix per kind (rows follow queries), built on first use
+    ratio_cache: Dict[str, Any] = {}
+
+    def get_kind_ratios(kind: str) -> Any:
+        if kind not in ratio_cache:
+            ratio_cache[kind] = _batch_fuzzy_ratios(
+                [q[4] for q in queries], [c[2] for c in get_kind_list(kind)]
+            )
+        return ratio_cache[kind]
 
+    results = []
+    for row, (missing_value, type_hint, expected_kind, base, base_norm) in enumerate(queries):
         if not missing_value:
             results.append(
                 {"missing_value": missing_value, "type_hint": type_hint, "candidates": []}
             )
             continue
 
-        base = basename(missing_value)
-        base_no_ext = _basename_no_ext(missing_value)
+        base_tokens = _match_tokens(base_norm)
         search_kinds = TYPE_HINT_MAP.get(type_hint) or ALL_MODEL_KINDS
 
         candidates = []
-        seen = set()
         exact_match_wrong_folder = None
 
         for kind in search_kinds:
-            for relpath in get_kind_list(kind):
-                if (kind, relpath) in seen:
-                    continue
-                seen.add((kind, relpath))
-                cand_base = basename(relpath)
-                cand_base_no_ext = _basename_no_ext(relpath)
-                score, reason = _candidate_score(base, cand_base)
+            ratios = get_kind_ratios(kind)
+            kind_entries = get_kind_list(kind)
+            for col in get_kind_index(kind).shortlist(base_norm, base_tokens):
+                relpath, cand_base, cand_norm, cand_tokens = kind_entries[col]
+                score, reason = _score_pretoken(
+                    base,
+                    base_norm,
+                    base_tokens,
+                    cand_base,
+                    cand_norm,
+                    cand_tokens,
+                    None if ratios is None else float(ratios[row][col]) / 100.0,
+                )
 
                 # Check if exact match but in wrong folder
                 in_wrong_folder = False
@@ -379,6 +653,37 @@ async def mjr_models_scan_candidates(request: web.Request) -> web.Response:
             }
         )
 
+    return results
+
+
+@PromptServer.instance.routes.post("/mjr_models/scan_candidates")
+async def mjr_models_scan_candidates(request: web.Request) -> web.Response:
+    """Scan for candidate model files that match missing models."""
+    auth_error = require_auth(request)
+    if auth_error:
+        return auth_error
+    rate_error = require_rate_limit(request, "models_search")
+    if rate_error:
+        return rate_error
+    origin_error = require_same_origin(request)
+    if origin_error:
+        return origin_error
+    if not require_json(request):
+        return json_error("Content-Type must be application/json", status=415)
+
+    body, error = await parse_json_body(request)
+    if error:
+        return error
+
+    raw_missing = body.get("missing")
+    if not isinstance(raw_missing, list):
+        return json_error("missing must be a list")
+    if len(raw_missing) > MAX_MISSING:
+        return json_error(f"missing exceeds limit ({MAX_MISSING})")
+
+    # Scoring is CPU-bound pure Python; keep it off the event loop
+    results = await asyncio.to_thread(_scan_candidates, raw_missing)
+
     audit_logger.log_event(
         request,
         action="models.scan_candidates",
@@ -386,7 +691,7 @@ async def mjr_models_scan_candidates(request: web.Request) -> web.Response:
         details={"missing_count": len(raw_missing), "result_count": len(results)},
         success=True,
     )
-    return web.json_response({"ok": True, "results": results})
+    return json_response({"ok": True, "results": results})
 
 
 @PromptServer.instance.routes.post("/mjr_models/build_fingerprint_cache")
@@ -436,7 +741,7 @@ async def mjr_models_build_fingerprint_cache(request: web.Request) -> web.Respon
         details={"count": int(result.get("count", 0)), "force": bool(force)},
         success=True,
     )
-    return web.json_response({"ok": True, **result})
+    return json_response({"ok": True, **result})
 
 
 @PromptServer.instance.routes.get("/mjr_models/fingerprint_cache_status")
@@ -448,10 +753,9 @@ async def mjr_models_fingerprint_cache_status(request: web.Request) -> web.Respo
     rate_error = require_rate_limit(request, "models_read")
     if rate_error:
         return rate_error
-    cache = _load_fingerprint_cache()
-    items = cache.get("items") or []
-    return web.json_response(
-        {"ok": True, "count": len(items), "updated_at": cache.get("updated_at", "")}
+    snapshot = await asyncio.to_thread(_get_fingerprint_snapshot)
+    return json_response(
+        {"ok": True, "count": snapshot["count"], "updated_at": snapshot["updated_at"]}
     )
 
 
@@ -481,12 +785,9 @@ async def mjr_models_resolve_by_fingerprint(request: web.Request) -> web.Respons
     if not fingerprint:
         return json_error("fingerprint is required")
 
-    cache = _load_fingerprint_cache()
-    for item in cache.get("items") or []:
-        if item.get("kind") == kind and item.get("fingerprint") == fingerprint:
-            return web.json_response({"ok": True, "relpath": item.get("relpath")})
-
-    return web.json_response({"ok": True, "relpath": None})
+    index = await asyncio.to_thread(_get_fingerprint_index)
+    relpath = index.get((kind, fingerprint))
+    return json_response({"ok": True, "relpath": relpath})
 
 
 @PromptServer.instance.routes.post("/mjr_models/move_to_correct_folder")
@@ -527,7 +828,7 @@ async def mjr_models_move_to_correct_folder(request: web.Request) -> web.Respons
 
     # Get source file path
     source_path = folder_paths.get_full_path(source_kind, source_relpath)
-    if not source_path or not os.path.exists(source_path):
+    if not source_path or not await asyncio.to_thread(os.path.exists, source_path):
         return json_error("source file not found", status=404)
 
     # Get target folder
@@ -542,7 +843,7 @@ async def mjr_models_move_to_correct_folder(request: web.Request) -> web.Respons
 
     # Ensure target folder exists
     try:
-        target_folder.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(target_folder.mkdir, parents=True, exist_ok=True)
     except Exception as e:
         logger.error("Failed to create target folder %s: %s", target_folder, e)
         return json_error(f"failed to create target folder: {e}", status=500)
@@ -552,13 +853,12 @@ async def mjr_models_move_to_correct_folder(request: web.Request) -> web.Respons
     target_path = target_folder / source_basename
 
     # Check if target already exists
-    if target_path.exists():
+    if await asyncio.to_thread(target_path.exists):
         return json_error("target file already exists", status=409)
 
     # Move the file
     try:
-        import shutil
-        shutil.move(str(source_path), str(target_path))
+        await asyncio.to_thread(_move_model_file, Path(source_path), target_path)
         logger.info("Moved model from %s (%s) to %s (%s)", source_relpath, source_kind, target_path, target_kind)
     except Exception as e:
         logger.error("Failed to move file from %s to %s: %s", source_path, target_path, e)
@@ -571,7 +871,7 @@ async def mjr_models_move_to_correct_folder(request: web.Request) -> web.Respons
         details={"source_kind": source_kind, "source_relpath": source_relpath, "target_kind": target_kind},
         success=True,
     )
-    return web.json_response({
+    return json_response({
         "ok": True,
         "target_relpath": source_basename,
     })
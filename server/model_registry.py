@@ -136,6 +136,9 @@ class ModelRegistry:
         results = []
         query_norm = self._normalize_name(query)
 
+        from .model_search_api import make_scorer
+        score_name = make_scorer(query, min_score=80)
+
         with self.lock:
             for model_hash, model_data in self.data.get("models", {}).items():
                 # Chercher dans les noms et aliases
@@ -144,13 +147,11 @@ class ModelRegistry:
                 all_names = names + aliases
 
                 # Score de matching
-                from .model_search_api import calculate_match_score
-
                 best_score = 0
                 best_match_name = ""
 
                 for name in all_names:
-                    score, _ = calculate_match_score(query, name)
+                    score, _ = score_name(name)
                     if score > best_score:
                         best_score = score
                         best_match_name = name
@@ -12,6 +12,7 @@ from server import PromptServer
 from .model_registry import get_model_registry
 from .route_utils import (
     json_error,
+    json_response,
     parse_json_body,
     require_json,
     require_same_origin,
@@ -73,7 +74,7 @@ async def mjr_models_registry_search(request: web.Request) -> web.Response:
             success=True,
         )
 
-        return web.json_response({
+        return json_response({
             "ok": True,
             "results": results,
             "total": len(results)
@@ -167,7 +168,7 @@ async def mjr_models_registry_contribute(request: web.Request) -> web.Response:
             success=success,
         )
 
-        return web.json_response({
+        return json_response({
             "ok": True,
             "added": success,
             "message": "Thank you for your contribution!" if success else "Source already exists"
@@ -219,7 +220,7 @@ async def mjr_models_registry_vote(request: web.Request) -> web.Response:
             success=success,
         )
 
-        return web.json_response({
+        return json_response({
             "ok": True,
             "voted": success,
             "vote_type": vote_type
@@ -266,7 +267,7 @@ async def mjr_models_registry_add_alias(request: web.Request) -> web.Response:
             success=success,
         )
 
-        return web.json_response({
+        return json_response({
             "ok": True,
             "added": success
         })
@@ -289,7 +290,7 @@ async def mjr_models_registry_stats(request: web.Request) -> web.Response:
         registry = get_model_registry()
         stats = registry.get_stats()
 
-        return web.json_response({
+        return json_response({
             "ok": True,
             **stats
         })
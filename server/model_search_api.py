@@ -4,19 +4,28 @@ Model search API for CivitAI, Hugging Face, and GitHub.
 
 from __future__ import annotations
 
+import heapq
 import logging
+import operator
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 from urllib.parse import quote, urlencode, urlparse
 from urllib.request import HTTPRedirectHandler, Request, build_opener
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
 import time
 import threading
 
+try:
+    import urllib3
+except ImportError:  # Optional; urllib.request is used when it is missing.
+    urllib3 = None
+
 # --- Hugging Face File Search ---
 
 # Whitelist of HF repos that are known to host useful model files directly
@@ -34,13 +43,65 @@ HF_FILE_SEARCH_REPOS = [
 ]
 
 # Cache for Hugging Face tree listings to avoid redundant API calls.
-# Format: { "repo_id": (timestamp, file_list) }
+# Format: { "repo_id": (expires_at, file_list) }
 _hf_tree_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
 _hf_tree_cache_lock = threading.Lock()
 HF_TREE_CACHE_TTL = 600  # 10 minutes
+HF_TREE_FAILURE_TTL = 30  # failed or empty fetches are retried much sooner
+
+# Cache for GitHub "latest release" lookups made by search_github.
+# Format: { "owner/repo": (expires_at, release_json) }
+_gh_release_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_gh_release_cache_lock = threading.Lock()
+GH_RELEASE_CACHE_TTL = 900  # 15 minutes
+
+# Cache for search_all_platforms_batch so repeated missing filenames do not re-query APIs.
+# Format: { (query, limit_per_platform): (expires_at, result) }
+_batch_search_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+_batch_search_cache_lock = threading.Lock()
+BATCH_SEARCH_CACHE_TTL = 600  # 10 minutes
+BATCH_SEARCH_CACHE_MAX = 256
 
 SEARCH_TIMEOUT = 30  # seconds - increased for more thorough search
 
+# Long-lived pool for the per-variant provider fan-out in search_all_platforms.
+# Provider calls are network-bound, so threads mostly sit in socket waits; one
+# search submits up to 4 variants x 4 providers, and batches run several searches.
+PROVIDER_WORKERS = 32
+_provider_executor = ThreadPoolExecutor(
+    max_workers=PROVIDER_WORKERS, thread_name_prefix="mjr-provider"
+)
+
+# Patterns for match-score normalization and query variants, compiled once
+_SEP_RE = re.compile(r'[-_\.]+')
+_NONALNUM_RE = re.compile(r'[^a-z0-9\s]')
+_WS_RE = re.compile(r'\s+')
+_DASH_UNDERSCORE_RE = re.compile(r'[-_]+')
+_UNDERSCORES_RE = re.compile(r'_+')
+# ASCII-only case folding: the suffixes are plain ASCII, so skip Unicode case rules
+_SUFFIX_RE = re.compile(
+    r'[-_](pruned|ema|emaonly|fp16|fp32|inpainting|training|diffusers)[-_]?', re.IGNORECASE | re.ASCII
+)
+# Maps '-' and '_' to spaces so str.split() can break query parts
+_SEP_TRANS = str.maketrans('-_', '  ')
+_MODEL_EXTS = ('.safetensors', '.ckpt', '.pt', '.pth', '.bin')
+# Extensions accepted for API/release downloads (no .pth)
+_DOWNLOAD_EXTS = ('.safetensors', '.ckpt', '.pt', '.bin')
+# ASCII fast path for normalization: everything except a-z0-9 becomes a space
+_NORMALIZE_TABLE = str.maketrans(
+    {chr(c): ' ' for c in range(128) if not ('a' <= chr(c) <= 'z' or '0' <= chr(c) <= '9')}
+)
+_VERSION_PART_RE = re.compile(r'v\d+')
+_SD_VERSION_RE = re.compile(r'^v(\d+)-(\d+)')
+_HF_BLOB_RE = re.compile(r'huggingface\.co/([^/]+)/([^/]+)/blob/')
+# Repo URLs probed by _extract_model_info_from_url, and HF repo links in DuckDuckGo HTML
+_HF_URL_RE = re.compile(r'https?://(?:www\.)?huggingface\.co/([^/]+)/([^/?#]+)')
+_GH_URL_RE = re.compile(r'https?://(?:www\.)?github\.com/([^/]+)/([^/?#]+)')
+_HF_REPO_LINK_RE = re.compile(r'huggingface\.co/([^/"\'\s<>?#&]+)/([^/"\'\s<>?#&]+)')
+# Sort key for result dicts once they are known to carry a match_score
+_by_score = operator.itemgetter("match_score")
+_PARTIAL_SCORE_CAP = 20  # 30 + 20 is the 50-point ceiling for partial matches
+
 
 class _NoAuthCrossHostRedirects(HTTPRedirectHandler):
     def redirect_request(self, req, fp, code, msg, headers, newurl):
@@ -58,6 +119,46 @@ class _NoAuthCrossHostRedirects(HTTPRedirectHandler):
         return newreq
 
 
+# Shared clients so repeated API calls to the same hosts reuse connections.
+# urllib3 strips Authorization on cross-host redirects by default, matching
+# _NoAuthCrossHostRedirects for the stdlib fallback.
+_opener = build_opener(_NoAuthCrossHostRedirects())
+_http_pool = (
+    urllib3.PoolManager(
+        num_pools=8,
+        maxsize=16,
+        timeout=urllib3.Timeout(connect=SEARCH_TIMEOUT, read=SEARCH_TIMEOUT),
+        retries=urllib3.Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504)),
+    )
+    if urllib3 is not None
+    else None
+)
+
+
+# (query_norm, query_words, query_grams) as built by _prepare_query
+_PreparedQuery = Tuple[str, FrozenSet[str], FrozenSet[str]]
+
+# Best score a candidate sharing no 3-character run with a query whose words all
+# have 3+ characters can still get: the 60 "Subset match" for a candidate that is
+# a slice of the query across word edges. No query word can be a common word.
+_NO_GRAM_MAX_SCORE = 60.0
+
+
+def _normalize_match_text(text: str) -> str:
+    """
+    Normalize lowercased text for scoring: drop a model extension and turn every
+    run of separators/special characters into a single space.
+    """
+    if text.endswith(_MODEL_EXTS):
+        text = text[:text.rindex('.')]
+    if text.isascii():
+        return ' '.join(text.translate(_NORMALIZE_TABLE).split())
+    # Unicode-safe path: \s and non-ASCII letters need the regex semantics
+    text = _SEP_RE.sub(' ', text)
+    text = _NONALNUM_RE.sub(' ', text)
+    return _WS_RE.sub(' ', text).strip()
+
+
 def calculate_match_score(query: str, candidate: str, filename: str = "") -> Tuple[float, str]:
     """
     Calculate how well a candidate matches the query.
@@ -66,28 +167,76 @@ def calculate_match_score(query: str, candidate: str, filename: str = "") -> Tup
     Returns:
         Tuple of (score from 0-100, match_level description)
     """
-    if not query or not candidate:
+    return calculate_match_score_prepared(_prepare_query(query), candidate, filename)
+
+
+def make_scorer(query: str, min_score: float = 0.0) -> Callable[..., Tuple[float, str]]:
+    """
+    Return calculate_match_score specialized to one query.
+
+    The query is normalized once; the returned callable takes
+    (candidate, filename="") and is meant for loops over many candidates.
+    Callers that drop scores below min_score may get 0 for such candidates.
+    """
+    prepared = _prepare_query(query, min_score)
+
+    def score(candidate: str, filename: str = "") -> Tuple[float, str]:
+        return calculate_match_score_prepared(prepared, candidate, filename)
+
+    return score
+
+
+def _prepare_query(query: str, min_score: float = 0.0) -> Optional[_PreparedQuery]:
+    """
+    Normalize a search query once so it can be scored against many candidates.
+
+    Returns (query_norm, query_words, query_grams), or None for an empty query.
+    query_grams holds the 3-character runs of the query's words. It is only
+    filled when every query word has at least 3 characters and min_score is
+    above _NO_GRAM_MAX_SCORE, so the caller discards every score the
+    pre-filter could hide; short words ("sd", "xl") can match whole words.
+    """
+    if not query:
+        return None
+    query_norm = _normalize_match_text(query.lower().strip())
+    query_words = frozenset(query_norm.split())
+    query_grams: FrozenSet[str] = frozenset()
+    if (
+        min_score > _NO_GRAM_MAX_SCORE
+        and len(query_norm) >= 5
+        and all(len(word) >= 3 for word in query_words)
+    ):
+        query_grams = frozenset(
+            word[i:i + 3] for word in query_words for i in range(len(word) - 2)
+        )
+    return query_norm, query_words, query_grams
+
+
+def calculate_match_score_prepared(
+    prepared: Optional[_PreparedQuery], candidate: str, filename: str = ""
+) -> Tuple[float, str]:
+    """calculate_match_score for a query already passed through _prepare_query."""
+    if prepared is None or not candidate:
         return 0.0, "No match"
 
-    query_lower = query.lower().strip()
+    query_norm, query_words, query_grams = prepared
     candidate_lower = candidate.lower().strip()
     filename_lower = filename.lower().strip()
+    # Cheap reject: sharing no 3-character run with the query, a candidate shares
+    # no query word either and scores at most _NO_GRAM_MAX_SCORE, which the
+    # caller discards anyway.
+    if query_grams and not any(g in candidate_lower or g in filename_lower for g in query_grams):
+        return 0.0, "No match"
+    return _score_cached(query_norm, query_words, candidate_lower, filename_lower)
+
 
-    # Normalize: remove common separators and extra spaces
-    def normalize(text):
-        # Remove extensions
-        text = re.sub(r'\.(safetensors|ckpt|pt|pth|bin)$', '', text, flags=re.IGNORECASE)
-        # Replace ALL separators (hyphens, underscores, dots) with spaces
-        text = re.sub(r'[-_\.]+', ' ', text)
-        # Remove special characters except alphanumeric and spaces
-        text = re.sub(r'[^a-z0-9\s]', ' ', text)
-        # Remove extra spaces
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
-
-    query_norm = normalize(query_lower)
-    candidate_norm = normalize(candidate_lower)
-    filename_norm = normalize(filename_lower)
+@lru_cache(maxsize=4096)
+def _score_cached(
+    query_norm: str, query_words: FrozenSet[str], candidate_lower: str, filename_lower: str
+) -> Tuple[float, str]:
+    """Scoring body of calculate_match_score, memoized on the normalized query and lowercased candidate."""
+    candidate_norm = _normalize_match_text(candidate_lower)
+    filename_norm = _normalize_match_text(filename_lower)
 
     # Exact match (100%)
     if query_norm == candidate_norm or query_norm == filename_norm:
@@ -119,16 +268,17 @@ def calculate_match_score(query: str, candidate: str, filename: str = "") -> Tup
             return 20.0, "Weak match"
 
     # Word-by-word matching: Give high scores for near-complete matches
-    query_words = set(query_norm.split())
-    candidate_words = set(candidate_norm.split())
-    filename_words = set(filename_norm.split())
-
-    all_words = candidate_words | filename_words
+    all_words = set(candidate_norm.split())
+    if filename_norm and filename_norm != candidate_norm:
+        all_words.update(filename_norm.split())
+    n_query = len(query_words)
+    n_all = len(all_words)
+    n_common = len(query_words & all_words)
 
     # Case 1: All query words are present in the candidate/filename.
     # This handles when the query is missing words (e.g., 'visual').
-    if query_words and query_words.issubset(all_words):
-        extra_words = len(all_words - query_words)
+    if n_query and n_common == n_query:
+        extra_words = n_all - n_query
         # Few extra words means a very strong match.
         if extra_words <= 2:
             return 96.0 - (extra_words * 3), "Near-exact word match"
@@ -138,17 +288,16 @@ def calculate_match_score(query: str, candidate: str, filename: str = "") -> Tup
 
     # Case 2: All candidate/filename words are present in the query.
     # This handles when the query has extra, irrelevant words.
-    if all_words and all_words.issubset(query_words):
-        extra_words = len(query_words - all_words)
+    if n_all and n_common == n_all:
+        extra_words = n_query - n_all
         if extra_words <= 2:
             return 94.0 - (extra_words * 3), "Candidate is subset of query"
         else:
             return 85.0, "Subset word match"
 
     # Case 3: Partial overlap, use Jaccard similarity.
-    if query_words or all_words:
-        common_words = query_words.intersection(all_words)
-        jaccard_sim = len(common_words) / len(query_words.union(all_words)) if (query_words or all_words) else 0
+    if n_query or n_all:
+        jaccard_sim = n_common / (n_query + n_all - n_common)
 
         if jaccard_sim >= 0.7:
             return 80.0, "High word similarity"
@@ -159,20 +308,46 @@ def calculate_match_score(query: str, candidate: str, filename: str = "") -> Tup
 
     # Fuzzy substring match (30-50%)
     # Check for partial word matches
+    partial_score = _partial_word_score(query_words, all_words)
+    if partial_score > 0:
+        score = min(50.0, 30.0 + partial_score)
+        return score, "Partial match"
+
+    # Very low or no match
+    return 10.0, "Poor match"
+
+
+def _partial_word_score(query_words: FrozenSet[str], all_words: set) -> int:
+    """Sum partial word hits between query and candidate words.
+
+    Query words shorter than 4 characters can never match (a candidate word
+    of 4+ characters cannot fit inside them), so only long query words are
+    scanned. The loop stops once the score reaches the 50-point cap.
+    """
     partial_score = 0
     for q_word in query_words:
+        if len(q_word) < 4:
+            continue
         for c_word in all_words:
-            if len(q_word) >= 4 and q_word in c_word:
+            if q_word in c_word:
                 partial_score += 10
             elif len(c_word) >= 4 and c_word in q_word:
                 partial_score += 8
+        if partial_score >= _PARTIAL_SCORE_CAP:
+            break
+    return partial_score
 
-    if partial_score > 0:
-        score = min(50.0, 30.0 + partial_score)
-        return score, "Partial match"
 
-    # Very low or no match
-    return 10.0, "Poor match"
+def _fetch_bytes(url: str, headers: Dict[str, str], timeout: float = SEARCH_TIMEOUT) -> bytes:
+    """GET url through the shared connection pool (or opener) and return the body; raises on HTTP errors."""
+    if _http_pool is not None:
+        resp = _http_pool.request("GET", url, headers=headers, timeout=timeout)
+        if resp.status >= 400:
+            raise OSError(f"HTTP Error {resp.status}: {resp.reason}")
+        return resp.data
+    request = Request(url, headers=headers)
+    with _opener.open(request, timeout=timeout) as resp:
+        return resp.read()
 
 
 def _make_request(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -182,11 +357,7 @@ def _make_request(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[st
     headers.setdefault("User-Agent", "ComfyUI-Majoor-Downloader")
 
     try:
-        request = Request(url, headers=headers)
-        opener = build_opener(_NoAuthCrossHostRedirects())
-        with opener.open(request, timeout=SEARCH_TIMEOUT) as resp:
-            data = resp.read()
-            return json.loads(data.decode("utf-8"))
+        return json.loads(_fetch_bytes(url, headers))
     except Exception as e:
         logger.warning("Request failed for %s: %s", url, str(e))
         return {}
@@ -214,6 +385,7 @@ def search_civitai(query: str, limit: int = 5) -> List[Dict[str, Any]]:
         }
     """
     results = []
+    prepared = _prepare_query(query)
 
     try:
         # CivitAI API search endpoint
@@ -280,7 +452,7 @@ def search_civitai(query: str, limit: int = 5) -> List[Dict[str, Any]]:
 
             # Calculate match score
             full_name = f"{model_name} - {version_name}"
-            score, match_level = calculate_match_score(query, full_name, primary_file.get("name", ""))
+            score, match_level = calculate_match_score_prepared(prepared, full_name, primary_file.get("name", ""))
 
             results.append({
                 "platform": "civitai",
@@ -299,12 +471,12 @@ def search_civitai(query: str, limit: int = 5) -> List[Dict[str, Any]]:
     except Exception as e:
         logger.error("CivitAI search failed: %s", str(e))
 
-    # Sort by match score (highest first) and filter out poor matches
-    results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
+    # Top matches by score (highest first), dropping poor matches
     # Only return results with score >= 30 (configurable threshold)
-    results = [r for r in results if r.get("match_score", 0) >= 30]
-
-    return results[:limit]
+    return heapq.nlargest(
+        limit, (r for r in results if r.get("match_score", 0) >= 30),
+        key=lambda x: x.get("match_score", 0),
+    )
 
 
 def _get_official_sd_models() -> Dict[str, Dict[str, Any]]:
@@ -347,14 +519,24 @@ def _get_official_sd_models() -> Dict[str, Dict[str, Any]]:
     }
 
 
+@lru_cache(maxsize=1)
+def _official_sd_model_keys() -> Tuple[Tuple[str, Dict[str, Any]], ...]:
+    """Official models paired with their lowercased, dash-separated key, built once."""
+    return tuple(
+        (model_key.lower().replace("_", "-"), model_info)
+        for model_key, model_info in _get_official_sd_models().items()
+    )
+
+
 def canonicalize_hf_url(url: str) -> str:
     """Converts a Hugging Face blob URL to a resolve URL for direct downloads."""
-    if not isinstance(url, str):
+    # Most URLs are already in resolve/ form; skip the regex for those.
+    if not isinstance(url, str) or '/blob/' not in url:
         return url
     
     # Example: https://huggingface.co/Kijai/WanVideo_comfy/blob/main/open-clip-xlm-roberta-large-vit-huge-14_visual_fp16.safetensors
     # ->        https://huggingface.co/Kijai/WanVideo_comfy/resolve/main/open-clip-xlm-roberta-large-vit-huge-14_visual_fp16.safetensors
-    return re.sub(r'huggingface\.co/([^/]+)/([^/]+)/blob/', r'huggingface.co/\1/\2/resolve/', url)
+    return _HF_BLOB_RE.sub(r'huggingface.co/\1/\2/resolve/', url)
 
 def _expand_hf_repo_wildcards(
     wildcards: List[str], query: str, limit: int
@@ -436,37 +618,36 @@ def _search_duckduckgo_repos(query: str, limit: int = 5) -> List[str]:
             "Accept-Language": "en-US,en;q=0.5"
         }
         
-        req = Request(url, headers=headers)
-        with build_opener().open(req, timeout=15) as resp:
-            html = resp.read().decode("utf-8", errors="ignore")
-            
-            # Regex to find huggingface.co links
-            # Matches: huggingface.co/User/Repo
-            # Excludes: /blob/, /resolve/, /tree/, /api/, etc. by pattern matching
-            
-            # We look for ANY huggingface.co link in the search results
-            import re
-            
-            # Find all HF links
-            # Pattern extracts User and Repo from URLs
-            matches = re.findall(r'huggingface\.co/([^/"\'\s<>?#&]+)/([^/"\'\s<>?#&]+)', html)
-            
-            ignored_users = {
-                "search", "datasets", "spaces", "api", "login", "join", 
-                "docs", "posts", "models", "users", "settings", "blog", "chat", "pricing"
-            }
+        html = _fetch_bytes(url, headers, timeout=15).decode("utf-8", errors="ignore")
+        
+        # Regex to find huggingface.co links
+        # Matches: huggingface.co/User/Repo
+        # Excludes: /blob/, /resolve/, /tree/, /api/, etc. by pattern matching
+        
+        # We look for ANY huggingface.co link in the search results
+        # Pattern extracts User and Repo from URLs
+        matches = _HF_REPO_LINK_RE.findall(html)
+        
+        ignored_users = {
+            "search", "datasets", "spaces", "api", "login", "join", 
+            "docs", "posts", "models", "users", "settings", "blog", "chat", "pricing"
+        }
+        
+        # Dedupe as links are read so the limit counts unique repos only
+        seen = set()
+        for user, repo in matches:
+            # Basic validation
+            if user in ignored_users: continue
+            if repo in {"blob", "resolve", "tree", "main", "full", "discussions"}: continue 
             
-            for user, repo in matches:
-                # Basic validation
-                if user in ignored_users: continue
-                if repo in {"blob", "resolve", "tree", "main", "full", "discussions"}: continue 
-                
-                full_id = f"{user}/{repo}"
-                if full_id not in candidates:
-                    candidates.append(full_id)
-                    if len(candidates) >= limit:
-                        break
-                        
+            full_id = f"{user}/{repo}"
+            if full_id in seen:
+                continue
+            seen.add(full_id)
+            candidates.append(full_id)
+            if len(candidates) >= limit:
+                break
+                    
         if candidates:
             logger.info(f"DuckDuckGo found potential HF repos: {candidates}")
             
@@ -476,6 +657,62 @@ def _search_duckduckgo_repos(query: str, limit: int = 5) -> List[str]:
     return candidates
 
 
+def _fetch_repo_tree(repo_id: str) -> List[Dict[str, Any]]:
+    """
+    Return the model files of a HF repo, from _hf_tree_cache when still fresh.
+
+    Only model-file entries are kept, trimmed to the fields the file search
+    reads, so large trees are not held in the cache in full.
+    """
+    with _hf_tree_cache_lock:
+        cached = _hf_tree_cache.get(repo_id)
+        if cached and time.time() < cached[0]:
+            logger.debug(f"Using cached file list for HF repo: {repo_id}")
+            return cached[1]
+
+    # Fetch outside the lock so concurrent repo fetches do not serialize.
+    files: List[Dict[str, Any]] = []
+    fetched = False
+    try:
+        # Fetch file list from HF API
+        api_url = f"https://huggingface.co/api/models/{repo_id}/tree/main?recursive=True"
+
+        # Get HF token if available
+        token = (
+            os.environ.get("HUGGINGFACE_HUB_TOKEN")
+            or os.environ.get("HF_TOKEN")
+            or os.environ.get("HUGGINGFACE_TOKEN")
+        )
+        headers = {}
+        if token:
+            headers["Authorization"] = f"Bearer {token}"
+
+        data = _make_request(api_url, headers)
+
+        if isinstance(data, list):
+            fetched = True
+            files = [
+                {
+                    "path": entry["path"],
+                    "size": entry.get("size", 0),
+                    "lfs": {"oid": (entry.get("lfs") or {}).get("oid")},
+                    "lastCommit": {"oid": (entry.get("lastCommit") or {}).get("oid", "main")},
+                }
+                for entry in data
+                if isinstance(entry, dict) and str(entry.get("path", "")).endswith(_MODEL_EXTS)
+            ]
+            logger.info(f"Fetched and cached file list for HF repo: {repo_id} ({len(files)} model files)")
+    except Exception as e:
+        logger.error(f"Failed to fetch file tree for HF repo {repo_id}: {e}")
+
+    # Cache failures (including error responses) for a shorter time to avoid
+    # hammering the API without blocking recovery for the full TTL.
+    ttl = HF_TREE_CACHE_TTL if fetched else HF_TREE_FAILURE_TTL
+    with _hf_tree_cache_lock:
+        _hf_tree_cache[repo_id] = (time.time() + ttl, files)
+    return files
+
+
 def _search_huggingface_repo_files(query: str, limit: int = 5, extra_repos: List[str] = None) -> List[Dict[str, Any]]:
     """
     Fallback search: Scans whitelisted AND dynamically found Hugging Face repos for individual files.
@@ -486,6 +723,7 @@ def _search_huggingface_repo_files(query: str, limit: int = 5, extra_repos: List
 
     logger.info(f"Running fallback Hugging Face file search for query: {query}")
     results = []
+    prepared = _prepare_query(query, min_score=75)
     
     # Start with base whitelist
     base_repos = list(HF_FILE_SEARCH_REPOS)
@@ -513,86 +751,74 @@ def _search_huggingface_repo_files(query: str, limit: int = 5, extra_repos: List
 
     logger.info(f"Scanning {len(repos_to_scan)} repos for files matching '{query}': {repos_to_scan}")
 
-    for repo_id in repos_to_scan:
-        if len(results) >= limit:
-            break
-
-        files = []
-        with _hf_tree_cache_lock:
-            cached = _hf_tree_cache.get(repo_id)
-            if cached and (time.time() - cached[0]) < HF_TREE_CACHE_TTL:
-                files = cached[1]
-                logger.debug(f"Using cached file list for HF repo: {repo_id}")
-            else:
-                try:
-                    # Fetch file list from HF API
-                    api_url = f"https://huggingface.co/api/models/{repo_id}/tree/main?recursive=True"
-                    
-                    # Get HF token if available
-                    token = (
-                        os.environ.get("HUGGINGFACE_HUB_TOKEN")
-                        or os.environ.get("HF_TOKEN")
-                        or os.environ.get("HUGGINGFACE_TOKEN")
-                    )
-                    headers = {}
-                    if token:
-                        headers["Authorization"] = f"Bearer {token}"
-                    
-                    data = _make_request(api_url, headers)
-                    
-                    if isinstance(data, list):
-                        files = data
-                        _hf_tree_cache[repo_id] = (time.time(), files)
-                        logger.info(f"Fetched and cached file list for HF repo: {repo_id} ({len(files)} files)")
-                except Exception as e:
-                    logger.error(f"Failed to fetch file tree for HF repo {repo_id}: {e}")
-                    # Cache the failure for a shorter time to avoid hammering the API
-                    _hf_tree_cache[repo_id] = (time.time(), [])
-
-        # Filter and score files
-        for file_info in files:
-            filepath = file_info.get("path", "")
-            
-            # Limit scan depth to avoid performance issues on huge repos
-            if len(results) > limit * 2: # Stop scanning files if we have a decent number of candidates
+    # Fetch repo trees concurrently but consume them in priority order, so the
+    # early stop below still prefers the first repos.
+    executor = ThreadPoolExecutor(
+        max_workers=min(8, len(repos_to_scan)), thread_name_prefix="mjr-hf-tree"
+    )
+    try:
+        trees = executor.map(_fetch_repo_tree, repos_to_scan)
+        for repo_id, files in zip(repos_to_scan, trees):
+            if len(results) >= limit:
                 break
+            _score_repo_files(prepared, repo_id, files, limit, results)
+    finally:
+        # Let in-flight fetches finish in the background (they still fill the cache).
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return heapq.nlargest(limit, results, key=lambda x: x.get("match_score", 0))
+
+
+def _score_repo_files(
+    prepared: Optional[_PreparedQuery],
+    repo_id: str,
+    files: List[Dict[str, Any]],
+    limit: int,
+    results: List[Dict[str, Any]],
+) -> None:
+    """Append matching model files from one repo tree to results."""
+    high_conf = sum(1 for r in results if r["match_score"] >= 95)
+    # Score files (_fetch_repo_tree already kept only model files)
+    for file_info in files:
+        filepath = file_info.get("path", "")
+        
+        # Limit scan depth to avoid performance issues on huge repos
+        if len(results) > limit * 2: # Stop scanning files if we have a decent number of candidates
+            break
+        # Enough near-exact hits already; the rest of the tree cannot outrank them.
+        if high_conf >= limit:
+            break
 
-            if not filepath.endswith((".safetensors", ".ckpt", ".pt", ".pth", ".bin")):
-                continue
-
-            filename = filepath.split('/')[-1]
-            score, match_level = calculate_match_score(query, filename, filename)
-
-            if score >= 75:  # Use a slightly lower threshold for this targeted search
-                # Construct download URL and ensure it's canonical
-                download_url = canonicalize_hf_url(
-                    f"https://huggingface.co/{repo_id}/resolve/main/{filepath}"
-                )
-                
-                # Guess type from filename
-                tags = repo_id.lower().split('/') + filename.lower().split('.')
-                kind = "checkpoints"
-                if "lora" in tags: kind = "loras"
-                elif "vae" in tags: kind = "vae"
-                elif "controlnet" in tags: kind = "controlnet"
-                elif "clip" in tags: kind = "clip"
-                
-                results.append({
-                    "platform": "huggingface",
-                    "name": f"{repo_id} (file)",
-                    "filename": filename,
-                    "url": download_url,
-                    "page_url": f"https://huggingface.co/{repo_id}/tree/main",
-                    "type": kind,
-                    "version": file_info.get("lastCommit", {}).get("oid", "main")[:7],
-                    "size_mb": int(file_info.get("size", 0) / (1024 * 1024)),
-                    "sha256": file_info.get("lfs", {}).get("oid"),
-                    "match_score": score,
-                    "match_level": f"{match_level} (in {repo_id})",
-                })
+        filename = filepath.split('/')[-1]
+        score, match_level = calculate_match_score_prepared(prepared, filename, filename)
 
-    results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
-    return results[:limit]
+        if score >= 75:  # Use a slightly lower threshold for this targeted search
+            # Construct download URL (already canonical resolve/ form)
+            download_url = f"https://huggingface.co/{repo_id}/resolve/main/{filepath}"
+            
+            # Guess type from filename
+            tags = repo_id.lower().split('/') + filename.lower().split('.')
+            kind = "checkpoints"
+            if "lora" in tags: kind = "loras"
+            elif "vae" in tags: kind = "vae"
+            elif "controlnet" in tags: kind = "controlnet"
+            elif "clip" in tags: kind = "clip"
+            
+            results.append({
+                "platform": "huggingface",
+                "name": f"{repo_id} (file)",
+                "filename": filename,
+                "url": download_url,
+                "page_url": f"https://huggingface.co/{repo_id}/tree/main",
+                "type": kind,
+                "version": file_info.get("lastCommit", {}).get("oid", "main")[:7],
+                "size_mb": int(file_info.get("size", 0) / (1024 * 1024)),
+                "sha256": file_info.get("lfs", {}).get("oid"),
+                "match_score": score,
+                "match_level": f"{match_level} (in {repo_id})",
+            })
+            if score >= 95:
+                high_conf += 1
 
 
 def search_huggingface(query: str, limit: int = 5) -> List[Dict[str, Any]]:
@@ -607,13 +833,13 @@ def search_huggingface(query: str, limit: int = 5) -> List[Dict[str, Any]]:
         List of results with same format as search_civitai
     """
     results = []
+    prepared = _prepare_query(query)
 
     # First, check if this matches a known official model
-    official_models = _get_official_sd_models()
     query_normalized = query.lower().strip().replace("_", "-").replace(" ", "-")
+    query_no_precision = query_normalized.replace("-fp16", "").replace("-fp32", "")
 
-    for model_key, model_info in official_models.items():
-        model_key_normalized = model_key.lower().replace("_", "-")
+    for model_key_normalized, model_info in _official_sd_model_keys():
         if model_key_normalized in query_normalized or query_normalized in model_key_normalized:
             # Direct match with official model
             model_id = model_info["model_id"]
@@ -626,14 +852,14 @@ def search_huggingface(query: str, limit: int = 5) -> List[Dict[str, Any]]:
                     download_url = f"https://huggingface.co/{model_id}/resolve/main/{fname}"
 
                     # Calculate match score
-                    score, match_level = calculate_match_score(query, model_info["name"], fname)
+                    score, match_level = calculate_match_score_prepared(prepared, model_info["name"], fname)
 
                     # Boost score for exact filename matches
                     fname_base = fname.lower().replace(".safetensors", "").replace(".ckpt", "")
                     if query_normalized == fname_base:
                         score = 100.0
                         match_level = "Exact match (official)"
-                    elif query_normalized.replace("-fp16", "").replace("-fp32", "") == fname_base:
+                    elif query_no_precision == fname_base:
                         # Match but with precision suffix
                         score = 98.0
                         match_level = "Exact match (fp16/fp32 variant)"
@@ -683,14 +909,12 @@ def search_huggingface(query: str, limit: int = 5) -> List[Dict[str, Any]]:
                     if mid: 
                         potential_repos_from_search.append(mid)
 
+            api_urls = set()
             for item in data:
                 model_id = item.get("id", "")
                 if not model_id:
                     continue
 
-                # For model search, we often don't get a specific file, so we score based on the model ID/name
-                score, match_level = calculate_match_score(query, model_id)
-
                 # Find a suitable file to download (prefer safetensors)
                 siblings = item.get("siblings", [])
                 best_file = None
@@ -705,7 +929,15 @@ def search_huggingface(query: str, limit: int = 5) -> List[Dict[str, Any]]:
                 if not best_file:
                     continue
 
-                download_url = canonicalize_hf_url(f"https://huggingface.co/{model_id}/resolve/main/{best_file}")
+                # Built in resolve/ form already, so canonicalize_hf_url would be a no-op.
+                download_url = f"https://huggingface.co/{model_id}/resolve/main/{best_file}"
+                # Only score models that yield a new downloadable file.
+                if download_url in api_urls:
+                    continue
+                api_urls.add(download_url)
+
+                # For model search, we often don't get a specific file, so we score based on the model ID/name
+                score, match_level = calculate_match_score_prepared(prepared, model_id)
                 
                 results.append({
                     "platform": "huggingface",
@@ -745,20 +977,35 @@ def search_huggingface(query: str, limit: int = 5) -> List[Dict[str, Any]]:
         if file_search_results:
             results.extend(file_search_results)
 
-    # De-duplicate results by URL, keeping the one with the highest score
-    seen_urls = {}
-    deduped_results = []
+    # One sort (highest first) drives de-duplication by URL, the poor-match
+    # cutoff and the limit, so a duplicate always keeps its best-scored entry.
+    seen_urls = set()
+    final_results = []
     for r in sorted(results, key=lambda x: x.get("match_score", 0), reverse=True):
+        if r.get("match_score", 0) < 30 or len(final_results) >= limit:
+            break
         url = r.get("url")
         if url not in seen_urls:
-            seen_urls[url] = r
-            deduped_results.append(r)
+            seen_urls.add(url)
+            final_results.append(r)
 
-    # Sort by match score (highest first) and filter out poor matches
-    deduped_results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
-    final_results = [r for r in deduped_results if r.get("match_score", 0) >= 30]
+    return final_results
 
-    return final_results[:limit]
+
+def _fetch_latest_release(full_name: str, headers: Dict[str, str]) -> Dict[str, Any]:
+    """Return the latest GitHub release of a repo, from _gh_release_cache when still fresh."""
+    with _gh_release_cache_lock:
+        cached = _gh_release_cache.get(full_name)
+        if cached and time.time() < cached[0]:
+            return cached[1]
+
+    releases_url = f"https://api.github.com/repos/{full_name}/releases/latest"
+    release = _make_request(releases_url, dict(headers))
+    # Repos without releases (or failed calls) come back empty; retry those sooner.
+    ttl = GH_RELEASE_CACHE_TTL if release else HF_TREE_FAILURE_TTL
+    with _gh_release_cache_lock:
+        _gh_release_cache[full_name] = (time.time() + ttl, release)
+    return release
 
 
 def search_github(query: str, limit: int = 5) -> List[Dict[str, Any]]:
@@ -773,6 +1020,7 @@ def search_github(query: str, limit: int = 5) -> List[Dict[str, Any]]:
         List of results with same format as search_civitai
     """
     results = []
+    prepared = _prepare_query(query)
 
     try:
         # GitHub search API
@@ -789,16 +1037,21 @@ def search_github(query: str, limit: int = 5) -> List[Dict[str, Any]]:
             headers["Authorization"] = f"token {token}"
 
         data = _make_request(url, headers)
-        items = data.get("items", [])
+        items = [item for item in data.get("items", [])[:limit] if item.get("full_name", "")]
 
-        for item in items[:limit]:
-            full_name = item.get("full_name", "")
-            if not full_name:
-                continue
+        # Fetch the latest release of every repo concurrently; assets are filtered in order below
+        def _latest_release(item: Dict[str, Any]) -> Dict[str, Any]:
+            return _fetch_latest_release(item["full_name"], headers)
 
-            # Get releases
-            releases_url = f"https://api.github.com/repos/{full_name}/releases/latest"
-            release_data = _make_request(releases_url, headers)
+        releases: List[Dict[str, Any]] = []
+        if items:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(items)), thread_name_prefix="mjr-gh-release"
+            ) as executor:
+                releases = list(executor.map(_latest_release, items))
+
+        for item, release_data in zip(items, releases):
+            full_name = item["full_name"]
 
             assets = release_data.get("assets", [])
             if not assets:
@@ -807,7 +1060,7 @@ def search_github(query: str, limit: int = 5) -> List[Dict[str, Any]]:
             # Find model files in assets
             for asset in assets:
                 name = asset.get("name", "")
-                if not name.endswith((".safetensors", ".ckpt", ".pt", ".bin")):
+                if not name.endswith(_DOWNLOAD_EXTS):
                     continue
 
                 download_url = asset.get("browser_download_url", "")
@@ -829,7 +1082,7 @@ def search_github(query: str, limit: int = 5) -> List[Dict[str, Any]]:
 
                 # Calculate match score
                 full_result_name = f"{full_name} - {name}"
-                score, match_level = calculate_match_score(query, full_result_name, name)
+                score, match_level = calculate_match_score_prepared(prepared, full_result_name, name)
 
                 results.append({
                     "platform": "github",
@@ -854,11 +1107,11 @@ def search_github(query: str, limit: int = 5) -> List[Dict[str, Any]]:
     except Exception as e:
         logger.error("GitHub search failed: %s", str(e))
 
-    # Sort by match score (highest first) and filter out poor matches
-    results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
-    results = [r for r in results if r.get("match_score", 0) >= 30]
-
-    return results[:limit]
+    # Top matches by score (highest first), dropping poor matches
+    return heapq.nlargest(
+        limit, (r for r in results if r.get("match_score", 0) >= 30),
+        key=lambda x: x.get("match_score", 0),
+    )
 
 
 def _generate_search_variants(query: str) -> List[str]:
@@ -872,20 +1125,22 @@ def _generate_search_variants(query: str) -> List[str]:
     variants = []
 
     # Remove file extension but keep the rest
-    query_clean = re.sub(r'\.(safetensors|ckpt|pt|pth|bin)$', '', query, flags=re.IGNORECASE)
+    query_clean = query
+    if query.lower().endswith(_MODEL_EXTS):
+        query_clean = query[:query.rindex('.')]
 
     # 1. Original query (cleaned)
     variants.append(query_clean)
 
     # 2. Replace underscores and hyphens with spaces for better matching
     # Example: "Qwen_Rapid_AIO-NSFW-v5.3" → "Qwen Rapid AIO NSFW v5.3"
-    query_with_spaces = re.sub(r'[-_]+', ' ', query_clean)
+    query_with_spaces = ' '.join(query_clean.translate(_SEP_TRANS).split())
     if query_with_spaces != query_clean:
         variants.append(query_with_spaces)
 
     # 3. Replace underscores with hyphens (some APIs prefer hyphens)
     # Example: "stable_diffusion_v1_5" → "stable-diffusion-v1-5"
-    query_with_hyphens = re.sub(r'_+', '-', query_clean)
+    query_with_hyphens = _UNDERSCORES_RE.sub('-', query_clean)
     if query_with_hyphens != query_clean and query_with_hyphens not in variants:
         variants.append(query_with_hyphens)
 
@@ -896,30 +1151,28 @@ def _generate_search_variants(query: str) -> List[str]:
     if len(query_clean) > 40:
         # Remove technical suffixes common in model names
         # Example: "model-name-v1.5-pruned-emaonly-fp16" → "model-name-v1.5"
-        compact = re.sub(r'[-_](pruned|ema|emaonly|fp16|fp32|inpainting|training|diffusers)[-_]?', '-',
-                        query_clean, flags=re.IGNORECASE)
-        compact = re.sub(r'[-_]+', '-', compact).strip('-')
+        compact = _SUFFIX_RE.sub('-', query_clean)
+        compact = _DASH_UNDERSCORE_RE.sub('-', compact).strip('-')
         if compact != query_clean and len(compact) >= 10:
             variants.append(compact)
 
     # 5. Extract main model name (first significant part before version/variant)
     # Example: "ModelName-v5.3-NSFW-AIO" → "ModelName"
     # But keep at least 2-3 meaningful parts for specificity
-    parts = re.split(r'[-_\s]+', query_clean)
+    parts = query_with_spaces.split()
     if len(parts) >= 3:
         # Keep first 2-3 meaningful parts (skip very short parts like v1, v2, etc.)
-        meaningful_parts = [p for p in parts if len(p) >= 3 or re.match(r'v\d+', p.lower())]
+        meaningful_parts = [p for p in parts if len(p) >= 3 or _VERSION_PART_RE.match(p.lower())]
         if len(meaningful_parts) >= 2:
             base_name = ' '.join(meaningful_parts[:3])  # Take first 3 meaningful parts
             if base_name not in variants and len(base_name) >= 10:
                 variants.append(base_name)
 
     # 6. Check if this is a known Stable Diffusion model
-    if re.match(r'^v\d+-\d+', normalized):
+    match = _SD_VERSION_RE.match(normalized)
+    if match:
         # Official SD model like "v1-5-pruned-emaonly"
-        match = re.match(r'^v(\d+)-(\d+)', normalized)
-        if match:
-            variants.append(f"stable diffusion {match.group(1)}.{match.group(2)}")
+        variants.append(f"stable diffusion {match.group(1)}.{match.group(2)}")
 
     # Remove duplicates while preserving order
     seen = set()
@@ -927,7 +1180,7 @@ def _generate_search_variants(query: str) -> List[str]:
     for v in variants:
         v_clean = v.strip()
         # Normalize for comparison (case-insensitive, space-normalized)
-        v_normalized = re.sub(r'\s+', ' ', v_clean.lower())
+        v_normalized = _WS_RE.sub(' ', v_clean.lower())
         if v_clean and v_normalized not in seen and len(v_clean) >= 3:
             seen.add(v_normalized)
             unique_variants.append(v_clean)
@@ -947,22 +1200,19 @@ def _extract_model_info_from_url(url: str, query: str) -> Optional[Dict[str, Any
     Returns:
         Dict with model info or None if extraction fails
     """
+    prepared = _prepare_query(query)
     try:
         # Hugging Face URL pattern: https://huggingface.co/{owner}/{model_name}
-        hf_match = re.match(r'https?://(?:www\.)?huggingface\.co/([^/]+)/([^/?#]+)', url)
+        hf_match = _HF_URL_RE.match(url)
         if hf_match:
             owner, model_name = hf_match.groups()
             full_name = f"{owner}/{model_name}"
 
-            # Try to get model files
-            api_url = f"https://huggingface.co/api/models/{owner}/{model_name}"
             headers = {"User-Agent": "ComfyUI-Majoor-Downloader"}
 
             try:
-                model_data = _make_request(api_url, headers)
-                tags = model_data.get("tags", [])
-
-                # Get files
+                # Get files (the tree listing is all we need; model metadata
+                # such as tags was fetched here before but never used)
                 files_url = f"https://huggingface.co/api/models/{owner}/{model_name}/tree/main"
                 files_data = _make_request(files_url, headers)
 
@@ -970,9 +1220,9 @@ def _extract_model_info_from_url(url: str, query: str) -> Optional[Dict[str, Any
                 if isinstance(files_data, list):
                     for file_info in files_data:
                         path = file_info.get("path", "")
-                        if path.endswith((".safetensors", ".ckpt", ".pt", ".bin")):
+                        if path.endswith(_DOWNLOAD_EXTS):
                             filename = path.split("/")[-1]
-                            score, match_level = calculate_match_score(query, full_name, filename)
+                            score, match_level = calculate_match_score_prepared(prepared, full_name, filename)
 
                             # Only return if score >= 80%
                             if score >= 80:
@@ -993,7 +1243,7 @@ def _extract_model_info_from_url(url: str, query: str) -> Optional[Dict[str, Any
                 logger.debug(f"Failed to fetch HF model details for {full_name}: {e}")
 
         # GitHub URL pattern: https://github.com/{owner}/{repo}
-        gh_match = re.match(r'https?://(?:www\.)?github\.com/([^/]+)/([^/?#]+)', url)
+        gh_match = _GH_URL_RE.match(url)
         if gh_match:
             owner, repo = gh_match.groups()
             full_name = f"{owner}/{repo}"
@@ -1008,8 +1258,8 @@ def _extract_model_info_from_url(url: str, query: str) -> Optional[Dict[str, Any
 
                 for asset in assets:
                     name = asset.get("name", "")
-                    if name.endswith((".safetensors", ".ckpt", ".pt", ".bin")):
-                        score, match_level = calculate_match_score(query, full_name, name)
+                    if name.endswith(_DOWNLOAD_EXTS):
+                        score, match_level = calculate_match_score_prepared(prepared, full_name, name)
 
                         # Only return if score >= 80%
                         if score >= 80:
@@ -1054,6 +1304,22 @@ def search_web_first(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     return []
 
 
+# Score bonus and match_level suffix added to API results, per platform
+_PLATFORM_BONUSES = {
+    "huggingface": (5, " [API+HF Priority]"),
+    "github": (3, " [API+GH Priority]"),
+    "modelscope": (2, " [ModelScope]"),
+}
+
+
+def _apply_platform_bonus(results: List[Dict[str, Any]], platform: str) -> None:
+    """Add the platform's priority bonus (capped at 100) and tag to each result in place."""
+    bonus, suffix = _PLATFORM_BONUSES[platform]
+    for r in results:
+        r["match_score"] = min(100.0, r["match_score"] + bonus)
+        r["match_level"] = r.get("match_level", "") + suffix
+
+
 def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, Any]:
     """
     Search all platforms using official APIs with community registry and aliases.
@@ -1081,8 +1347,6 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
             }
         }
     """
-    import concurrent.futures
-
     results = {
         "query": query,
         "total_results": 0,
@@ -1138,33 +1402,46 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
     civitai_limit = limit_per_platform
     modelscope_limit = limit_per_platform
 
+    try:
+        from .model_search_modelscope import search_modelscope
+    except ImportError:
+        logger.debug("ModelScope search not available")
+        search_modelscope = None
+
+    # Search 4 platforms for every variant at once on the shared provider pool.
+    # Variants are still merged in order, and the early stop below cancels the
+    # searches that have not started yet.
+    executor = _provider_executor
+    variant_futures = []
     for search_query in search_queries:
-        # Search 4 platforms in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            future_hf = executor.submit(search_huggingface, search_query, hf_limit)
-            future_gh = executor.submit(search_github, search_query, gh_limit)
-            future_civitai = executor.submit(search_civitai, search_query, civitai_limit)
-
-            # Add ModelScope search
-            try:
-                from .model_search_modelscope import search_modelscope
-                future_modelscope = executor.submit(search_modelscope, search_query, modelscope_limit)
-            except ImportError:
-                logger.debug("ModelScope search not available")
-                future_modelscope = None
-
-            # Collect results
-            def _resolve_future(future, platform: str) -> List[Dict[str, Any]]:
-                try:
-                    return future.result()
-                except Exception as exc:
-                    logger.warning("%s search failed for '%s': %s", platform, search_query, exc)
-                    return []
-
-            hf_results = _resolve_future(future_hf, "huggingface")
-            gh_results = _resolve_future(future_gh, "github")
-            civitai_results = _resolve_future(future_civitai, "civitai")
-            modelscope_results = _resolve_future(future_modelscope, "modelscope") if future_modelscope else []
+        variant_futures.append((
+            search_query,
+            executor.submit(search_huggingface, search_query, hf_limit),
+            executor.submit(search_github, search_query, gh_limit),
+            executor.submit(search_civitai, search_query, civitai_limit),
+            (
+                executor.submit(search_modelscope, search_query, modelscope_limit)
+                if search_modelscope is not None
+                else None
+            ),
+        ))
+
+    def _resolve_future(future, platform: str, search_query: str) -> List[Dict[str, Any]]:
+        if future is None:
+            return []
+        try:
+            return future.result()
+        except Exception as exc:
+            logger.warning("%s search failed for '%s': %s", platform, search_query, exc)
+            return []
+
+    good_count = 0
+    for search_query, future_hf, future_gh, future_civitai, future_modelscope in variant_futures:
+        # Collect results
+        hf_results = _resolve_future(future_hf, "huggingface", search_query)
+        gh_results = _resolve_future(future_gh, "github", search_query)
+        civitai_results = _resolve_future(future_civitai, "civitai", search_query)
+        modelscope_results = _resolve_future(future_modelscope, "modelscope", search_query)
 
         # Filter API results to only keep score >= 80%
         hf_results = [r for r in hf_results if r.get("match_score", 0) >= 80]
@@ -1173,17 +1450,9 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
         modelscope_results = [r for r in modelscope_results if r.get("match_score", 0) >= 80]
 
         # Apply platform priority bonus to scores
-        for r in hf_results:
-            r["match_score"] = min(100.0, r.get("match_score", 0) + 5)
-            r["match_level"] = f"{r.get('match_level', '')} [API+HF Priority]"
-
-        for r in gh_results:
-            r["match_score"] = min(100.0, r.get("match_score", 0) + 3)
-            r["match_level"] = f"{r.get('match_level', '')} [API+GH Priority]"
-
-        for r in modelscope_results:
-            r["match_score"] = min(100.0, r.get("match_score", 0) + 2)
-            r["match_level"] = f"{r.get('match_level', '')} [ModelScope]"
+        _apply_platform_bonus(hf_results, "huggingface")
+        _apply_platform_bonus(gh_results, "github")
+        _apply_platform_bonus(modelscope_results, "modelscope")
 
         all_results_by_platform["huggingface"].extend(hf_results)
         all_results_by_platform["github"].extend(gh_results)
@@ -1191,37 +1460,33 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
         all_results_by_platform["modelscope"].extend(modelscope_results)
 
         # Check if we have enough good results to stop searching
-        all_good_results = [
-            r
-            for r in (
-                all_results_by_platform["huggingface"] +
-                all_results_by_platform["github"] +
-                all_results_by_platform["civitai"] +
-                all_results_by_platform["modelscope"]
-            )
-            if r.get("match_score", 0) >= 80
-        ]
-        if len(all_good_results) >= 5:
+        # (everything kept above already scores >= 80, so counting is enough)
+        good_count += len(hf_results) + len(gh_results) + len(civitai_results) + len(modelscope_results)
+        if good_count >= 5:
             logger.info(f"Found enough good results (>= 80%) with query: {search_query}")
             break
 
+    # Drop variant searches still queued after an early stop (no-op for finished ones).
+    for _query, *futures in variant_futures:
+        for future in futures:
+            if future is not None:
+                future.cancel()
+
     # Deduplicate results by URL and sort by score
     # IMPORTANT: Only keep results with score >= 80%
     def deduplicate_and_filter(results_list, max_results, min_score=80):
         seen_urls = set()
         unique = []
-        for r in sorted(results_list, key=lambda x: x.get("match_score", 0), reverse=True):
-            score = r.get("match_score", 0)
+        # Filter: only keep results with score >= min_score
+        eligible = [r for r in results_list if r["match_score"] >= min_score]
+        for r in sorted(eligible, key=_by_score, reverse=True):
             url = r.get("url", "")
-
-            # Filter: only keep results with score >= min_score
-            if score < min_score:
-                continue
-
             if url and url not in seen_urls:
                 seen_urls.add(url)
                 unique.append(r)
-        return unique[:max_results]
+                if len(unique) >= max_results:
+                    break
+        return unique
 
     # STEP 4: Deduplicate and filter all results (score >= 80%)
     results["platforms"]["huggingface"] = deduplicate_and_filter(all_results_by_platform["huggingface"], hf_limit, min_score=80)
@@ -1238,12 +1503,17 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
     # 3. CivitAI
     # 4. GitHub
     # 5. ModelScope
-    all_results = []
-    all_results.extend(results["platforms"]["community_registry"])
-    all_results.extend(results["platforms"]["huggingface"])
-    all_results.extend(results["platforms"]["civitai"])
-    all_results.extend(results["platforms"]["github"])
-    all_results.extend(results["platforms"]["modelscope"])
+    # Every platform list is already sorted by score (highest first), so a
+    # stable merge gives the global order; ties keep the priority order above.
+    all_results = list(heapq.merge(
+        results["platforms"]["community_registry"],
+        results["platforms"]["huggingface"],
+        results["platforms"]["civitai"],
+        results["platforms"]["github"],
+        results["platforms"]["modelscope"],
+        key=_by_score,
+        reverse=True,
+    ))
 
     # Log filtering results
     logger.info(f"After filtering (score >= 80%): {len(all_results)} results total")
@@ -1253,9 +1523,6 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
     logger.info(f"  GitHub: {len(results['platforms']['github'])}")
     logger.info(f"  ModelScope: {len(results['platforms']['modelscope'])}")
 
-    # Sort globally by match score (already filtered to >= 80%)
-    all_results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
-
     results["total_results"] = len(all_results)
     results["sorted_results"] = all_results  # Add globally sorted results
 
@@ -1269,8 +1536,60 @@ def search_all_platforms(query: str, limit_per_platform: int = 3) -> Dict[str, A
         "query_variants_used": len(search_queries),
         "platforms_searched": 5,  # registry, hf, civitai, github, modelscope
         "total_matches_found": len(all_results),
-        "excellent_matches": len([r for r in all_results if r.get("match_score", 0) >= 95]),
-        "good_matches": len([r for r in all_results if 85 <= r.get("match_score", 0) < 95]),
+        "excellent_matches": sum(1 for r in all_results if r["match_score"] >= 95),
+        "good_matches": sum(1 for r in all_results if 85 <= r["match_score"] < 95),
     }
 
     return results
+
+
+def search_all_platforms_batch(
+    queries: List[str], limit_per_platform: int = 3, max_workers: int = 8
+) -> List[Dict[str, Any]]:
+    """
+    Run search_all_platforms for several queries concurrently.
+
+    Identical queries are searched once, and results are reused for
+    BATCH_SEARCH_CACHE_TTL seconds. search_all_platforms reports provider
+    errors as an empty result, so results with nothing found are only kept for
+    HF_TREE_FAILURE_TTL. A query whose search raises yields an empty dict (not
+    cached) so one bad entry does not fail the batch.
+
+    Args:
+        queries: Model names to search for
+        limit_per_platform: Maximum results per platform for each query
+        max_workers: Number of queries searched at the same time
+
+    Returns:
+        One result dict per query, in the same order as queries
+    """
+    unique_queries = list(dict.fromkeys(queries))
+    if not unique_queries:
+        return []
+
+    def _search(query: str) -> Dict[str, Any]:
+        cache_key = (query, limit_per_platform)
+        with _batch_search_cache_lock:
+            cached = _batch_search_cache.get(cache_key)
+            if cached and time.time() < cached[0]:
+                return cached[1]
+        try:
+            result = search_all_platforms(query, limit_per_platform)
+        except Exception as exc:
+            logger.warning("Batch search failed for '%s': %s", query, exc)
+            return {}
+        # An empty result may just be a network blip; retry it much sooner.
+        found = result.get("total_results")
+        ttl = BATCH_SEARCH_CACHE_TTL if found else HF_TREE_FAILURE_TTL
+        with _batch_search_cache_lock:
+            _batch_search_cache.pop(cache_key, None)
+            if len(_batch_search_cache) >= BATCH_SEARCH_CACHE_MAX:
+                # Drop the oldest entry (dicts keep insertion order).
+                _batch_search_cache.pop(next(iter(_batch_search_cache)))
+            _batch_search_cache[cache_key] = (time.time() + ttl, result)
+        return result
+
+    workers = max(1, min(max_workers, len(unique_queries)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        found = dict(zip(unique_queries, executor.map(_search, unique_queries)))
+    return [found[q] for q in queries]
@@ -5,6 +5,7 @@ ModelScope (Alibaba Cloud) hosts many Chinese and international models.
 
 from __future__ import annotations
 
+import heapq
 import logging
 from typing import Any, Dict, List
 from urllib.parse import urlencode
@@ -28,7 +29,9 @@ def search_modelscope(query: str, limit: int = 5) -> List[Dict[str, Any]]:
     Returns:
         List of results matching standard format
     """
+    from .model_search_api import make_scorer
     results = []
+    score_match = make_scorer(query, min_score=80)
 
     try:
         # ModelScope search API
@@ -84,9 +87,8 @@ def search_modelscope(query: str, limit: int = 5) -> List[Dict[str, Any]]:
                         download_url = f"https://www.modelscope.cn/models/{author_name}/{model_name}/resolve/master/{filename}"
 
                     # Calculate match score
-                    from .model_search_api import calculate_match_score
                     full_name = f"{author_name}/{model_name}"
-                    score, match_level = calculate_match_score(query, full_name, filename)
+                    score, match_level = score_match(full_name, filename)
 
                     if score < 80:
                         continue
@@ -128,5 +130,4 @@ def search_modelscope(query: str, limit: int = 5) -> List[Dict[str, Any]]:
         logger.error(f"ModelScope search failed: {e}")
 
     # Sort by match score
-    results.sort(key=lambda x: x.get("match_score", 0), reverse=True)
-    return results[:limit]
+    return heapq.nlargest(limit, results, key=lambda x: x.get("match_score", 0))
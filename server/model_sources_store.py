@@ -9,12 +9,14 @@ import os
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from .project_store import read_json, safe_under_output, write_json_atomic
 
 logger = logging.getLogger(__name__)
 _SOURCES_LOCK = threading.RLock()
+# (st_mtime_ns, st_size) of model_sources.json and its parsed content
+_sources_snapshot: Tuple[Tuple[int, int], Dict[str, Any]] | None = None
 
 SCHEMA_VERSION = 1
 
@@ -28,28 +30,42 @@ def _basename(value: str) -> str:
 
 
 def load_sources() -> Dict[str, Any]:
+    """Return model_sources.json, re-read only when the file changes on disk."""
+    global _sources_snapshot
     with _SOURCES_LOCK:
         path = _sources_path()
+        try:
+            st = path.stat()
+            stamp = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            stamp = None
+        cached = _sources_snapshot
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+
         data = read_json(path, {}, strict=False)
         if not isinstance(data, dict) or data.get("schema") != SCHEMA_VERSION:
-            return {"schema": SCHEMA_VERSION, "updated_at": "", "items": []}
-        items = data.get("items")
-        if not isinstance(items, list):
-            items = []
-        return {
-            "schema": SCHEMA_VERSION,
-            "updated_at": str(data.get("updated_at") or ""),
-            "items": items,
-        }
+            result = {"schema": SCHEMA_VERSION, "updated_at": "", "items": []}
+        else:
+            items = data.get("items")
+            if not isinstance(items, list):
+                items = []
+            result = {
+                "schema": SCHEMA_VERSION,
+                "updated_at": str(data.get("updated_at") or ""),
+                "items": items,
+            }
+        _sources_snapshot = (stamp, result) if stamp is not None else None
+        return result
 
 
 def resolve_recipes(missing: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     data = load_sources()
-    by_key = {}
-    for item in data.get("items") or []:
-        key = item.get("key")
-        if isinstance(key, str) and key:
-            by_key[key] = item
+    by_key = {
+        key: item
+        for item in data.get("items") or []
+        if isinstance(key := item.get("key"), str) and key
+    }
 
     resolved = []
     for entry in missing or []:
@@ -69,26 +85,33 @@ def resolve_recipes(missing: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
 
 def save_recipes(items: List[Dict[str, Any]]) -> None:
+    global _sources_snapshot
     with _SOURCES_LOCK:
         data = load_sources()
-        merged = {}
-        for item in data.get("items") or []:
-            key = item.get("key")
-            if isinstance(key, str) and key:
-                merged[key] = item
-
-        for item in items or []:
-            key = item.get("key")
-            if not isinstance(key, str) or not key:
-                continue
-            merged[key] = item
+        merged = {
+            key: item
+            for item in data.get("items") or []
+            if isinstance(key := item.get("key"), str) and key
+        }
+        merged.update(
+            (key, item)
+            for item in items or []
+            if isinstance(key := item.get("key"), str) and key
+        )
 
         updated_at = datetime.now().isoformat()
         payload = {
             "schema": SCHEMA_VERSION,
             "updated_at": updated_at,
-            "items": sorted(merged.values(), key=lambda x: x.get("key", "")),
+            "items": [merged[key] for key in sorted(merged)],
         }
         path = _sources_path()
         path.parent.mkdir(parents=True, exist_ok=True)
         write_json_atomic(path, payload)
+        # The payload is exactly what load_sources would parse back; keep it
+        # as the snapshot so the next resolve does not re-read the file.
+        try:
+            st = path.stat()
+            _sources_snapshot = ((st.st_mtime_ns, st.st_size), payload)
+        except OSError:
+            _sources_snapshot = None
@@ -6,9 +6,12 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
+import os
 import re
 import asyncio
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from aiohttp import web
 
@@ -25,6 +28,7 @@ from .project_store import (
     get_workflow_lock,
     get_role_dir,
     load_index,
+    lookup_by_folder,
     make_kind_token,
     make_media_dir,
     model_tag,
@@ -43,6 +47,7 @@ from .project_store import (
 )
 from .route_utils import (
     json_error as _json_error,
+    json_response as _json_response,
     require_json as _require_json,
     to_bool as _to_bool,
     parse_json_body as _parse_json_body,
@@ -67,6 +72,27 @@ PATH_WIDGETS_DEFAULT = [
 MAX_PROJECT_NAME_LENGTH = 255
 MAX_WORKFLOW_FILENAME_LENGTH = 115
 
+# Leading slash/backslash, colon, or parent reference ("..")
+_UNSAFE_RE = re.compile(r"^[/\\]|:|\.\.")
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Model category listings served by /mjr_project/models, reused for a few seconds
+MODEL_CATEGORIES = [
+    "diffusion_models",
+    "checkpoints",
+    "vae",
+    "loras",
+    "text_encoders",
+    "clip",
+    "clip_vision",
+    "controlnet",
+    "upscale_models",
+    "embeddings",
+    "unet",
+]
+MODELS_CACHE_TTL = 5.0  # seconds
+_models_cache: Tuple[float, Dict[str, List[str]]] | None = None
+
 
 def _has_unsafe(value: str) -> bool:
     """
@@ -85,14 +111,7 @@ def _has_unsafe(value: str) -> bool:
     """
     if value is None:
         return True
-    v = str(value)
-    if v.startswith("/") or v.startswith("\\"):
-        return True
-    if ":" in v:
-        return True
-    if ".." in v:
-        return True
-    return False
+    return _UNSAFE_RE.search(str(value)) is not None
 
 
 def _now_iso() -> str:
@@ -121,14 +140,17 @@ def _validate_date_yymmdd(date: str) -> bool:
         >>> _validate_date_yymmdd("999999")
         False
     """
-    if not date or not date.isdigit() or len(date) != 6:
+    if not date or len(date) != 6 or not date.isascii() or not date.isdigit():
         return False
-    try:
-        # Parse as YYMMDD
-        datetime.strptime(date, "%y%m%d")
-        return True
-    except ValueError:
+    # Same calendar as strptime("%y%m%d"): every YY maps to 1969-2068, where
+    # YY % 4 == 0 is exactly the leap-year rule.
+    month = int(date[2:4])
+    day = int(date[4:6])
+    if not 1 <= month <= 12:
         return False
+    if month == 2 and int(date[:2]) % 4 == 0:
+        return 1 <= day <= 29
+    return 1 <= day <= _DAYS_IN_MONTH[month - 1]
 
 
 def _load_index_or_error() -> Tuple[Optional[Dict[str, Any]], Optional[web.Response]]:
@@ -255,7 +277,7 @@ async def mjr_project_set(request: web.Request) -> web.Response:
         success=True,
     )
 
-    return web.json_response(
+    return _json_response(
         {
             "ok": True,
             "project_id": project_id,
@@ -265,6 +287,33 @@ async def mjr_project_set(request: web.Request) -> web.Response:
     )
 
 
+def _existing_project_folders(folders: List[str]) -> Set[str]:
+    """
+    The given folders that exist under PROJECTS (empty when the root is missing).
+
+    One scandir answers exact names; a folder it misses is stat-ed, so
+    case-insensitive filesystems (macOS, Windows) still match a folder whose
+    case differs from the index.
+    """
+    try:
+        projects_root = safe_under_output("PROJECTS")
+        with os.scandir(projects_root) as entries:
+            names = {e.name for e in entries}
+    except Exception:
+        return set()
+    found = set()
+    for folder in folders:
+        if folder in names:
+            found.add(folder)
+            continue
+        try:
+            if (projects_root / folder).exists():
+                found.add(folder)
+        except Exception:
+            pass
+    return found
+
+
 @PromptServer.instance.routes.get("/mjr_project/list")
 async def mjr_project_list(request: web.Request) -> web.Response:
     """List all projects with optional filtering."""
@@ -281,30 +330,24 @@ async def mjr_project_list(request: web.Request) -> web.Response:
     # Optional filter: include_archived (default: false)
     include_archived = request.query.get("include_archived", "").lower() in ("1", "true", "yes")
 
-    # Batch check: get PROJECTS root once instead of per-project
-    try:
-        projects_root = safe_under_output("PROJECTS")
-        projects_root_exists = projects_root.exists()
-    except Exception:
-        projects_root_exists = False
+    # Skip archived projects unless requested
+    visible = [
+        (project_id, entry)
+        for project_id, entry in index.items()
+        if include_archived or not entry.get("archived", False)
+    ]
+
+    # Batch check: one directory read of PROJECTS instead of a stat per project
+    existing = await asyncio.to_thread(
+        _existing_project_folders,
+        [entry.get("folder") for _, entry in visible if entry.get("folder")],
+    )
 
     projects: List[Dict[str, Any]] = []
-    for project_id, entry in index.items():
-        # Skip archived projects unless requested
+    for project_id, entry in visible:
         is_archived = entry.get("archived", False)
-        if is_archived and not include_archived:
-            continue
-
         folder = entry.get("folder", "")
-        exists = False
-
-        if folder and projects_root_exists:
-            try:
-                # Only check if parent exists (avoids N filesystem calls)
-                project_path = projects_root / folder
-                exists = project_path.exists()
-            except Exception:
-                exists = False
+        exists = bool(folder) and folder in existing
 
         projects.append(
             {
@@ -318,7 +361,7 @@ async def mjr_project_list(request: web.Request) -> web.Response:
         )
 
     projects.sort(key=lambda x: x.get("last_used") or "", reverse=True)
-    return web.json_response({"ok": True, "projects": projects})
+    return _json_response({"ok": True, "projects": projects})
 
 
 @PromptServer.instance.routes.get("/mjr_project/models")
@@ -329,28 +372,24 @@ async def mjr_project_models(request: web.Request) -> web.Response:
     rate_error = _require_rate_limit(request, "project_read")
     if rate_error:
         return rate_error
+    global _models_cache
+    cached = _models_cache
+    now = time.monotonic()
+    if cached is None or now - cached[0] >= MODELS_CACHE_TTL:
+        # Listing rescans the model folders; keep it off the event loop.
+        categories = await asyncio.to_thread(_list_model_categories)
+        cached = _models_cache = (now, categories)
+    return _json_response({"ok": True, "categories": cached[1]})
+
+
+def _list_model_categories() -> Dict[str, List[str]]:
     def try_list(cat: str) -> List[str]:
         try:
             return sorted(folder_paths.get_filename_list(cat))
         except Exception:
             return []
 
-    categories = {}
-    for cat in ["diffusion_models", "checkpoints"]:
-        categories[cat] = try_list(cat)
-    for cat in [
-        "vae",
-        "loras",
-        "text_encoders",
-        "clip",
-        "clip_vision",
-        "controlnet",
-        "upscale_models",
-        "embeddings",
-        "unet",
-    ]:
-        categories[cat] = try_list(cat)
-    return web.json_response({"ok": True, "categories": categories})
+    return {cat: try_list(cat) for cat in MODEL_CATEGORIES}
 
 
 @PromptServer.instance.routes.get("/mjr_project/config")
@@ -361,7 +400,7 @@ async def mjr_project_config(request: web.Request) -> web.Response:
     rate_error = _require_rate_limit(request, "project_read")
     if rate_error:
         return rate_error
-    return web.json_response({"ok": True, "path_widgets": PATH_WIDGETS_DEFAULT})
+    return _json_response({"ok": True, "path_widgets": PATH_WIDGETS_DEFAULT})
 
 
 @PromptServer.instance.routes.get("/mjr_security/csrf")
@@ -386,7 +425,7 @@ async def mjr_security_csrf(request: web.Request) -> web.Response:
     else:
         logger.debug("[MJR] Returning existing CSRF token")
 
-    resp = web.json_response({"ok": True, "csrf_token": token})
+    resp = _json_response({"ok": True, "csrf_token": token})
     resp.set_cookie(
         "mjr_csrf",
         token,
@@ -450,7 +489,7 @@ async def mjr_project_assets_list_names(request: web.Request) -> web.Response:
         except Exception:
             pass
 
-    return web.json_response({"ok": True, "names": sorted(names)})
+    return _json_response({"ok": True, "names": sorted(names)})
 
 
 @PromptServer.instance.routes.get("/mjr_project/resolve")
@@ -465,20 +504,14 @@ async def mjr_project_resolve(request: web.Request) -> web.Response:
     if not folder or _has_unsafe(folder):
         return _json_error("folder is invalid or missing")
 
-    folder_norm = folder.casefold()
-    index, error = _load_index_or_error()
-    if error:
-        return error
-
     # Check for duplicate folders (case-insensitive)
-    matches = []
-    for project_id, entry in index.items():
-        entry_folder = (entry.get("folder") or "").strip()
-        if entry_folder and entry_folder.casefold() == folder_norm:
-            matches.append((project_id, entry_folder))
+    try:
+        matches = lookup_by_folder(folder)
+    except ValueError as e:
+        return _json_error(str(e), status=500)
 
     if not matches:
-        return web.json_response({"ok": False, "error": "not_found"}, status=404)
+        return _json_response({"ok": False, "error": "not_found"}, status=404)
 
     if len(matches) > 1:
         # Multiple projects with same folder name (case-insensitive)
@@ -486,7 +519,7 @@ async def mjr_project_resolve(request: web.Request) -> web.Response:
         logger.warning(f"Multiple projects found for folder '{folder}': {[m[0] for m in matches]}")
 
     project_id, entry_folder = matches[0]
-    return web.json_response(
+    return _json_response(
         {"ok": True, "project_id": project_id, "folder": entry_folder}
     )
 
@@ -524,7 +557,7 @@ async def mjr_project_preview_template(request: web.Request) -> web.Response:
     except Exception as e:
         return _json_error(str(e), status=400)
 
-    return web.json_response({"ok": True, "preview": preview})
+    return _json_response({"ok": True, "preview": preview})
 
 
 @PromptServer.instance.routes.post("/mjr_project/create_custom_out")
@@ -629,7 +662,7 @@ async def mjr_project_create_custom_out(request: web.Request) -> web.Response:
         success=True,
     )
 
-    return web.json_response(
+    return _json_response(
         {
             "ok": True,
             "rel_dir": rel_dir,
@@ -715,43 +748,19 @@ async def mjr_project_workflow_save(request: web.Request) -> web.Response:
     except Exception as e:
         return _json_error(str(e), status=400)
 
-    # Use per-project lock instead of global lock
-    workflow_lock = get_workflow_lock(project_id)
-    with workflow_lock:
-        pattern = re.compile(rf"^{re.escape(file_base)}_(\d{{4}})\.json$", re.IGNORECASE)
-        max_index = 0
-        if workflows_dir.exists():
-            try:
-                for entry in workflows_dir.iterdir():
-                    if not entry.is_file():
-                        continue
-                    match = pattern.match(entry.name)
-                    if match:
-                        try:
-                            idx = int(match.group(1))
-                            if idx > max_index:
-                                max_index = idx
-                        except ValueError:
-                            continue
-            except Exception:
-                pass
-        next_index = max_index + 1
-        suffix = f"{next_index:04d}"
-        file_name = f"{file_base}_{suffix}.json"
-
-        project_rel_path = f"{workflows_rel_dir}/{file_name}"
-        try:
-            project_path = safe_under_output(project_rel_path)
-        except Exception as e:
-            return _json_error(str(e), status=400)
-
-        if project_path.exists() and not overwrite:
-            return _json_error("workflow file already exists", status=409)
-
-        try:
-            write_json_file_atomic(project_path, workflow)
-        except Exception as e:
-            return _json_error(f"failed to save workflow: {e}", status=500)
+    # Scan, pick the next index and write under the per-project lock, in a worker
+    # thread so neither the directory scan nor a contended lock blocks the loop.
+    file_name, project_rel_path, save_error = await asyncio.to_thread(
+        _save_next_workflow,
+        project_id,
+        workflows_dir,
+        workflows_rel_dir,
+        file_base,
+        workflow,
+        overwrite,
+    )
+    if save_error:
+        return save_error
 
     mirrored = False
     comfy_rel = ""
@@ -797,7 +806,7 @@ async def mjr_project_workflow_save(request: web.Request) -> web.Response:
         success=True,
     )
 
-    return web.json_response(
+    return _json_response(
         {
             "ok": True,
             "project_rel_path": project_rel_path,
@@ -812,6 +821,54 @@ async def mjr_project_workflow_save(request: web.Request) -> web.Response:
     )
 
 
+def _max_workflow_index(workflows_dir: Path, file_base: str) -> int:
+    """Highest NNNN among {file_base}_NNNN.json files in workflows_dir (0 if none)."""
+    pattern = re.compile(rf"^{re.escape(file_base)}_(\d{{4}})\.json$", re.IGNORECASE)
+    max_index = 0
+    try:
+        # scandir gives the file type from the directory entry, without a stat per file
+        with os.scandir(workflows_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                match = pattern.match(entry.name)
+                if match:
+                    max_index = max(max_index, int(match.group(1)))
+    except Exception:
+        pass
+    return max_index
+
+
+def _save_next_workflow(
+    project_id: str,
+    workflows_dir: Path,
+    workflows_rel_dir: str,
+    file_base: str,
+    workflow: Dict[str, Any],
+    overwrite: bool,
+) -> Tuple[str, str, Optional[web.Response]]:
+    """Write workflow as the next numbered file; returns (file_name, project_rel_path, error)."""
+    # Use per-project lock instead of global lock
+    with get_workflow_lock(project_id):
+        next_index = _max_workflow_index(workflows_dir, file_base) + 1
+        file_name = f"{file_base}_{next_index:04d}.json"
+
+        project_rel_path = f"{workflows_rel_dir}/{file_name}"
+        try:
+            project_path = safe_under_output(project_rel_path)
+        except Exception as e:
+            return file_name, project_rel_path, _json_error(str(e), status=400)
+
+        if project_path.exists() and not overwrite:
+            return file_name, project_rel_path, _json_error("workflow file already exists", status=409)
+
+        try:
+            write_json_file_atomic(project_path, workflow)
+        except Exception as e:
+            return file_name, project_rel_path, _json_error(f"failed to save workflow: {e}", status=500)
+    return file_name, project_rel_path, None
+
+
 @PromptServer.instance.routes.post("/mjr_project/archive")
 async def mjr_project_archive(request: web.Request) -> web.Response:
     """Archive a project (hide from active list)."""
@@ -846,7 +903,7 @@ async def mjr_project_archive(request: web.Request) -> web.Response:
     try:
         archive_project(project_id)
         audit_logger.log_event(request, action="project.archive", resource=project_id, details={}, success=True)
-        return web.json_response({"ok": True, "project_id": project_id})
+        return _json_response({"ok": True, "project_id": project_id})
     except Exception as e:
         audit_logger.log_event(request, action="project.archive", resource=project_id, details={"error": str(e)}, success=False)
         return _json_error(f"Failed to archive project: {str(e)}", status=500)
@@ -886,7 +943,7 @@ async def mjr_project_unarchive(request: web.Request) -> web.Response:
     try:
         unarchive_project(project_id)
         audit_logger.log_event(request, action="project.unarchive", resource=project_id, details={}, success=True)
-        return web.json_response({"ok": True, "project_id": project_id})
+        return _json_response({"ok": True, "project_id": project_id})
     except Exception as e:
         audit_logger.log_event(request, action="project.unarchive", resource=project_id, details={"error": str(e)}, success=False)
         return _json_error(f"Failed to unarchive project: {str(e)}", status=500)
@@ -929,7 +986,7 @@ async def mjr_project_delete(request: web.Request) -> web.Response:
         deleted = delete_project_from_index(project_id)
         if deleted:
             audit_logger.log_event(request, action="project.delete", resource=project_id, details={}, success=True)
-            return web.json_response(
+            return _json_response(
                 {
                     "ok": True,
                     "project_id": project_id,
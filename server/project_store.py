@@ -14,15 +14,27 @@ import unicodedata
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Tuple
 
 import folder_paths
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when it is missing.
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Thread lock for index operations (prevents concurrent modification)
 _index_lock = threading.RLock()
 
+# Parsed index keyed by (st_mtime_ns, st_size) of the file; load_index returns copies
+_index_snapshot: Tuple[Tuple[int, int], Dict[str, Any]] | None = None
+
+# casefolded folder -> [(project_id, folder), ...] built from the index file,
+# keyed by its (st_mtime_ns, st_size) so external edits are picked up too
+_folder_lookup: Tuple[Tuple[int, int], Dict[str, List[Tuple[str, str]]]] | None = None
+
 # Per-project workflow save locks
 _workflow_locks: Dict[str, threading.Lock] = {}
 _workflow_locks_lock = threading.Lock()
@@ -429,6 +441,26 @@ def ensure_dirs(list_rel: Iterable[str]) -> None:
         ensure_dir(rel)
 
 
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when installed, else (or on rejection) stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # stdlib json accepts a few things orjson rejects (e.g. NaN) and reports errors
+    return json.loads(raw)
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize to indented JSON bytes with orjson when installed, else stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # Fall back to stdlib json for types orjson does not handle
+    return json.dumps(data, indent=2, ensure_ascii=True).encode("utf-8")
+
+
 def read_json(path: Path, default: Any, strict: bool = False) -> Any:
     """Read JSON file with size validation and proper error handling."""
     try:
@@ -458,16 +490,15 @@ def read_json(path: Path, default: Any, strict: bool = False) -> Any:
                 st = os.fstat(fd)
                 if not stat.S_ISREG(st.st_mode):
                     raise ValueError(f"Not a regular file: {path}")
-                with os.fdopen(fd, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with os.fdopen(fd, "rb") as f:
+                    return _json_loads(f.read())
             finally:
                 try:
                     os.close(fd)
                 except Exception:
                     pass
 
-        content = path.read_text(encoding="utf-8")
-        return json.loads(content)
+        return _json_loads(path.read_bytes())
 
     except json.JSONDecodeError as e:
         msg = f"Invalid JSON in {path}: {e}"
@@ -509,11 +540,11 @@ def write_json_atomic(path: Path, data: Any) -> None:
             raise ValueError(f"Refusing to write to symlink: {path}")
 
         # Write to temp file
-        content = json.dumps(data, indent=2, ensure_ascii=True)
+        content = _json_dumps(data)
         if os.name != "nt" and hasattr(os, "O_NOFOLLOW"):
             fd = os.open(str(tmp), os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
             try:
-                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                with os.fdopen(fd, "wb") as f:
                     f.write(content)
             finally:
                 try:
@@ -521,7 +552,7 @@ def write_json_atomic(path: Path, data: Any) -> None:
                 except Exception:
                     pass
         else:
-            tmp.write_text(content, encoding="utf-8")
+            tmp.write_bytes(content)
 
         # Atomic replace
         os.replace(tmp, path)
@@ -548,15 +579,68 @@ def get_index_path() -> Path:
 
 def load_index() -> Dict[str, Any]:
     """Load project index with thread safety."""
+    global _index_snapshot
     with _index_lock:
-        return read_json(get_index_path(), {}, strict=True)
+        stamp = _index_stamp()
+        cached = _index_snapshot
+        if stamp is None or cached is None or cached[0] != stamp:
+            index = read_json(get_index_path(), {}, strict=True)
+            _index_snapshot = (stamp, index) if stamp is not None else None
+        else:
+            index = cached[1]
+        return _copy_index(index)
+
+
+def _copy_index(index: Any) -> Any:
+    # Entries are flat dicts, so copying one level keeps the cache safe from callers.
+    if not isinstance(index, dict):
+        return index
+    return {
+        pid: dict(entry) if isinstance(entry, dict) else entry
+        for pid, entry in index.items()
+    }
 
 
 def save_index(index: Dict[str, Any]) -> None:
     """Save project index with thread safety."""
+    global _folder_lookup, _index_snapshot
     with _index_lock:
         index_path = get_index_path()
         write_json_atomic(index_path, index or {})
+        stamp = _index_stamp()
+        _index_snapshot = (stamp, _copy_index(index or {})) if stamp else None
+        _folder_lookup = None
+
+
+def _index_stamp() -> Tuple[int, int] | None:
+    try:
+        st = get_index_path().stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def lookup_by_folder(folder: str) -> List[Tuple[str, str]]:
+    """
+    Return (project_id, folder) for every project whose folder matches, case-insensitively.
+
+    Uses a reverse index rebuilt only when the index file changes.
+    Raises ValueError like load_index when the index cannot be read.
+    """
+    global _folder_lookup
+    with _index_lock:
+        stamp = _index_stamp()
+        cached = _folder_lookup
+        if stamp is None or cached is None or cached[0] != stamp:
+            by_folder: Dict[str, List[Tuple[str, str]]] = {}
+            for project_id, entry in load_index().items():
+                entry_folder = (entry.get("folder") or "").strip()
+                if entry_folder:
+                    matches = by_folder.setdefault(entry_folder.casefold(), [])
+                    matches.append((project_id, entry_folder))
+            cached = (stamp, by_folder)
+            _folder_lookup = cached if stamp is not None else None
+        return list(cached[1].get(folder.casefold(), ()))
 
 
 def update_index_atomic(project_id: str, updater_fn) -> Dict[str, Any]:
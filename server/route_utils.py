@@ -14,6 +14,31 @@ from typing import Any, Tuple
 
 from aiohttp import web
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when it is missing.
+    orjson = None
+
+
+def json_response(data: Any, status: int = 200) -> web.Response:
+    """
+    Create a JSON response, serialized with orjson when it is installed.
+
+    Args:
+        data: JSON-serializable payload
+        status: HTTP status code (default: 200)
+
+    Returns:
+        application/json response
+    """
+    if orjson is not None:
+        try:
+            body = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            return web.Response(body=body, status=status, content_type="application/json")
+        except TypeError:
+            pass  # Fall back to stdlib json for types orjson does not handle
+    return web.json_response(data, status=status)
+
 
 def json_error(message: str, status: int = 400) -> web.Response:
     """
@@ -26,7 +51,7 @@ def json_error(message: str, status: int = 400) -> web.Response:
     Returns:
         JSON response with {"ok": False, "error": message}
     """
-    return web.json_response({"ok": False, "error": message}, status=status)
+    return json_response({"ok": False, "error": message}, status=status)
 
 
 def require_json(request: web.Request) -> bool:
@@ -189,7 +214,10 @@ async def parse_json_body(request: web.Request) -> tuple[dict[str, Any] | None,
         # Use body...
     """
     try:
-        body = await request.json()
+        if orjson is not None:
+            body = orjson.loads(await request.read())
+        else:
+            body = await request.json()
         if not isinstance(body, dict):
             return None, json_error("request body must be a JSON object")
         return body, None
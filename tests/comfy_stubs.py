@@ -0,0 +1,64 @@
+"""
+Minimal stand-ins for the ComfyUI modules the server routes import.
+
+``folder_paths`` and ``server.PromptServer`` only exist inside a running
+ComfyUI, so tests install small fakes and import the route modules from
+``server/`` as the ``mjr_server`` package.
+"""
+
+import importlib
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+from aiohttp import web
+
+ROOT = Path(__file__).resolve().parents[1]
+PACKAGE = "mjr_server"
+
+# kind -> ([folders], {extensions}); tests replace entries as needed.
+folder_names_and_paths = {}
+_legacy_kinds = {"unet": "diffusion_models", "clip": "text_encoders"}
+_output_dir = tempfile.mkdtemp(prefix="mjr-test-output-")
+
+
+def _map_legacy(kind):
+    return _legacy_kinds.get(kind, kind)
+
+
+def _get_folder_paths(kind):
+    return list(folder_names_and_paths[_map_legacy(kind)][0])
+
+
+def _install_stubs() -> None:
+    if "folder_paths" not in sys.modules:
+        fp = types.ModuleType("folder_paths")
+        fp.folder_names_and_paths = folder_names_and_paths
+        fp.supported_pt_extensions = {
+            ".ckpt", ".pt", ".pt2", ".bin", ".pth", ".safetensors"
+        }
+        fp.map_legacy = _map_legacy
+        fp.get_folder_paths = _get_folder_paths
+        fp.get_output_directory = lambda: _output_dir
+        fp.get_user_directory = lambda: _output_dir
+        fp.get_base_path = lambda: _output_dir
+        sys.modules["folder_paths"] = fp
+    if not hasattr(sys.modules.get("server"), "PromptServer"):
+        srv = types.ModuleType("server")
+        srv.PromptServer = types.SimpleNamespace(
+            instance=types.SimpleNamespace(
+                routes=web.RouteTableDef(), app=web.Application()
+            )
+        )
+        sys.modules["server"] = srv
+    if PACKAGE not in sys.modules:
+        pkg = types.ModuleType(PACKAGE)
+        pkg.__path__ = [str(ROOT / "server")]
+        sys.modules[PACKAGE] = pkg
+
+
+def load_server_module(name: str):
+    """Import server/<name>.py with the ComfyUI stubs in place."""
+    _install_stubs()
+    return importlib.import_module(f"{PACKAGE}.{name}")
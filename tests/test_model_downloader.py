@@ -0,0 +1,341 @@
+import functools
+import hashlib
+import re
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+from urllib.parse import urlparse
+
+from aiohttp import ClientSession, web
+from aiohttp.test_utils import TestServer
+
+import comfy_stubs
+from comfy_stubs import load_server_module
+
+downloader = load_server_module("model_downloader_routes")
+
+DATA = bytes(range(256)) * 8
+ETAG = '"v1"'
+_RANGE_RE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+def _requested_range(request):
+    match = _RANGE_RE.fullmatch(request.headers.get("Range", ""))
+    if not match:
+        return None
+    start = int(match.group(1))
+    end = int(match.group(2)) if match.group(2) else len(DATA) - 1
+    return start, end
+
+
+def _fake_token_headers(url, token):
+    return {"Authorization": "Bearer t"}
+
+
+def _allow_hosts(*hosts):
+    def validate(url):
+        if urlparse(url).hostname in hosts:
+            return True, ""
+        return False, "host is not allowed"
+
+    return validate
+
+
+class _DownloadTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        self.tmp = Path(tempfile.mkdtemp(prefix="mjr-dl-"))
+        app = web.Application(middlewares=[self._record])
+        app.router.add_get("/ranged", self._ranged)
+        app.router.add_get("/no-range", self._no_range)
+        app.router.add_get("/chunked-206", self._chunked_206)
+        app.router.add_get("/wrong-span", self._wrong_span)
+        app.router.add_get("/short-206", self._short_206)
+        app.router.add_get("/chunked", self._chunked)
+        app.router.add_get("/to-localhost", self._to_localhost)
+        app.router.add_get("/resume-416", self._resume_416)
+        app.router.add_get("/resume-from-zero", self._resume_from_zero)
+        self.server = TestServer(app, host="127.0.0.1")
+        await self.server.start_server()
+        self.session = ClientSession(auto_decompress=False)
+        patches = [
+            mock.patch.object(downloader, "_validate_url", _allow_hosts("127.0.0.1")),
+            mock.patch.object(
+                downloader,
+                "_range_parts",
+                functools.partial(downloader._range_parts, part_size=512),
+            ),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def asyncTearDown(self):
+        await self.session.close()
+        await self.server.close()
+
+    @web.middleware
+    async def _record(self, request, handler):
+        self.requests.append((request.method, request.path, dict(request.headers)))
+        return await handler(request)
+
+    def url(self, path, host="127.0.0.1"):
+        return f"http://{host}:{self.server.port}{path}"
+
+    def range_gets(self):
+        return [h for m, _, h in self.requests if m == "GET" and "Range" in h]
+
+    # Handlers -------------------------------------------------------------
+
+    async def _ranged(self, request):
+        span = _requested_range(request)
+        if_range = request.headers.get("If-Range", ETAG)
+        if span is None or request.method == "HEAD" or if_range != ETAG:
+            return web.Response(
+                body=DATA, headers={"Accept-Ranges": "bytes", "ETag": ETAG}
+            )
+        start, end = span
+        return web.Response(
+            status=206,
+            body=DATA[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(DATA)}", "ETag": ETAG},
+        )
+
+    async def _no_range(self, request):
+        return web.Response(body=DATA, headers={"Accept-Ranges": "bytes"})
+
+    async def _stream_206(self, request, payload, content_range):
+        resp = web.StreamResponse(status=206, headers={"Content-Range": content_range})
+        resp.enable_chunked_encoding()
+        await resp.prepare(request)
+        await resp.write(payload)
+        await resp.write_eof()
+        return resp
+
+    async def _chunked_206(self, request):
+        span = _requested_range(request)
+        if span is None or request.method == "HEAD":
+            return await self._no_range(request)
+        start, end = span
+        header = f"bytes {start}-{end}/{len(DATA)}"
+        payload = DATA[start : end + 1] + b"x" * 100
+        return await self._stream_206(request, payload, header)
+
+    async def _wrong_span(self, request):
+        span = _requested_range(request)
+        if span is None or request.method == "HEAD":
+            return await self._no_range(request)
+        start, end = span
+        header = f"bytes {start + 1}-{end + 1}/{len(DATA)}"
+        return await self._stream_206(request, DATA[start + 1 : end + 2], header)
+
+    async def _short_206(self, request):
+        span = _requested_range(request)
+        if span is None or request.method == "HEAD":
+            return await self._no_range(request)
+        start, end = span
+        header = f"bytes {start}-{end}/{len(DATA)}"
+        return await self._stream_206(request, DATA[start:end], header)
+
+    async def _chunked(self, request):
+        resp = web.StreamResponse()
+        resp.enable_chunked_encoding()
+        await resp.prepare(request)
+        await resp.write(DATA)
+        await resp.write_eof()
+        return resp
+
+    async def _resume_416(self, request):
+        if "Range" in request.headers:
+            return web.Response(status=416)
+        return web.Response(body=DATA)
+
+    async def _resume_from_zero(self, request):
+        if "Range" not in request.headers:
+            return web.Response(body=DATA)
+        header = f"bytes 0-{len(DATA) - 1}/{len(DATA)}"
+        return web.Response(status=206, body=DATA, headers={"Content-Range": header})
+
+    async def _to_localhost(self, request):
+        raise web.HTTPFound(self.url("/ranged", host="localhost"))
+
+    # Drivers --------------------------------------------------------------
+
+    async def download(self, url, max_bytes=0, sha256=None):
+        item = {
+            "key": "k",
+            "url": url,
+            "filename": "model.safetensors",
+            "kind": "checkpoints",
+            "sha256": sha256,
+        }
+        return await downloader._download_single_async(
+            self.session, "job", item, 1, 1, max_bytes, {"checkpoints": self.tmp}
+        )
+
+    @property
+    def target(self):
+        return self.tmp / "model.safetensors"
+
+
+class TestRangedDownload(_DownloadTestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        patcher = mock.patch.object(downloader, "RANGED_MIN_BYTES", 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_parts_reassemble_file(self):
+        digest = hashlib.sha256(DATA).hexdigest()
+        result = await self.download(self.url("/ranged"), sha256=digest)
+        self.assertEqual(result["status"], "ok")
+        self.assertEqual(self.target.read_bytes(), DATA)
+        self.assertEqual(len(self.range_gets()), len(DATA) // 512)
+
+    async def test_200_to_range_falls_back_to_single_stream(self):
+        await self.download(self.url("/no-range"))
+        self.assertEqual(self.target.read_bytes(), DATA)
+        plain_gets = [h for m, _, h in self.requests if m == "GET" and "Range" not in h]
+        self.assertEqual(len(plain_gets), 1)
+
+    async def test_chunked_206_past_range_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "longer than requested"):
+            await self.download(self.url("/chunked-206"))
+        self.assertFalse(self.target.exists())
+
+    async def test_206_for_other_span_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "does not match the requested range"):
+            await self.download(self.url("/wrong-span"))
+        self.assertFalse(self.target.exists())
+
+    async def test_short_206_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "ended early"):
+            await self.download(self.url("/short-206"))
+        self.assertFalse(self.target.exists())
+
+    async def test_probed_size_over_max_bytes_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "size limit"):
+            await self.download(self.url("/ranged"), max_bytes=len(DATA) - 1)
+        self.assertEqual(self.range_gets(), [])
+
+    async def test_redirect_to_disallowed_host_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "disallowed url"):
+            await self.download(self.url("/to-localhost"))
+        self.assertEqual(self.range_gets(), [])
+
+    async def test_token_kept_on_same_host(self):
+        with mock.patch.object(downloader, "_prepare_headers", _fake_token_headers):
+            await self.download(self.url("/ranged"))
+        self.assertTrue(all(h.get("Authorization") for h in self.range_gets()))
+
+    async def test_token_dropped_after_cross_host_redirect(self):
+        with mock.patch.object(
+            downloader, "_validate_url", _allow_hosts("127.0.0.1", "localhost")
+        ), mock.patch.object(downloader, "_prepare_headers", _fake_token_headers):
+            await self.download(self.url("/to-localhost"))
+        self.assertEqual(self.target.read_bytes(), DATA)
+        self.assertTrue(self.range_gets())
+        self.assertFalse(any("Authorization" in h for h in self.range_gets()))
+
+
+class TestStreamDownload(_DownloadTestCase):
+    async def test_chunked_body_over_max_bytes_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "size limit"):
+            await self.download(self.url("/chunked"), max_bytes=len(DATA) - 1)
+        self.assertFalse(self.target.exists())
+
+    async def test_content_length_over_max_bytes_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "size limit"):
+            await self.download(self.url("/no-range"), max_bytes=len(DATA) - 1)
+        self.assertFalse(self.target.exists())
+
+    async def test_redirect_to_disallowed_host_is_rejected(self):
+        with self.assertRaisesRegex(ValueError, "disallowed url"):
+            await self.download(self.url("/to-localhost"))
+        self.assertFalse(self.target.exists())
+
+
+class TestStreamResume(_DownloadTestCase):
+    async def stream(self, path, existing, validator=ETAG):
+        tmp_path = self.tmp / "model.safetensors.part"
+        if existing:
+            tmp_path.write_bytes(existing)
+        hasher = hashlib.sha256()
+        self.resume_state = {"validator": validator} if validator else {}
+        await downloader._download_stream(
+            self.session, "job", "k", self.url(path), {}, tmp_path, hasher, 0,
+            self.resume_state,
+        )
+        return tmp_path, hasher
+
+    async def test_first_response_validator_is_recorded(self):
+        await self.stream("/ranged", b"", validator=None)
+        self.assertEqual(self.resume_state, {"validator": ETAG})
+
+    async def test_resume_appends_after_rehashing_existing_bytes(self):
+        tmp_path, hasher = await self.stream("/ranged", DATA[:1000])
+        self.assertEqual(self.range_gets()[0]["Range"], "bytes=1000-")
+        self.assertEqual(self.range_gets()[0]["If-Range"], ETAG)
+        self.assertEqual(tmp_path.read_bytes(), DATA)
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(DATA).hexdigest())
+
+    async def test_changed_file_is_fetched_whole(self):
+        tmp_path, hasher = await self.stream("/ranged", b"old!" * 250, '"v0"')
+        self.assertEqual(tmp_path.read_bytes(), DATA)
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(DATA).hexdigest())
+        self.assertEqual(self.resume_state, {"validator": ETAG})
+
+    async def test_partial_without_validator_is_discarded(self):
+        tmp_path, _ = await self.stream("/ranged", b"stale bytes", validator=None)
+        self.assertEqual(self.range_gets(), [])
+        self.assertEqual(tmp_path.read_bytes(), DATA)
+
+    async def test_206_at_other_offset_discards_partial_file(self):
+        tmp_path = self.tmp / "model.safetensors.part"
+        with self.assertRaises(downloader._ResumeRejected):
+            await self.stream("/resume-from-zero", DATA[:1000])
+        self.assertFalse(tmp_path.exists())
+
+    async def test_200_to_resume_restarts_file(self):
+        tmp_path, hasher = await self.stream("/no-range", b"stale bytes")
+        self.assertEqual(tmp_path.read_bytes(), DATA)
+        self.assertEqual(hasher.hexdigest(), hashlib.sha256(DATA).hexdigest())
+
+    async def test_416_discards_partial_file(self):
+        tmp_path = self.tmp / "model.safetensors.part"
+        with self.assertRaises(downloader._ResumeRejected):
+            await self.stream("/resume-416", DATA[:1000])
+        self.assertFalse(tmp_path.exists())
+
+
+class TestValidateItems(unittest.TestCase):
+    def setUp(self):
+        root = Path(tempfile.mkdtemp(prefix="mjr-models-"))
+        for kind in ("text_encoders", "vae"):
+            comfy_stubs.folder_names_and_paths[kind] = ([str(root / kind)], set())
+            self.addCleanup(comfy_stubs.folder_names_and_paths.pop, kind)
+        downloader._resolve_target_dir_cached.cache_clear()
+        self.addCleanup(downloader._resolve_target_dir_cached.cache_clear)
+        patcher = mock.patch.object(
+            downloader, "_validate_url", _allow_hosts("127.0.0.1")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_items_writing_the_same_file_keep_the_first(self):
+        url = "http://127.0.0.1/models/model.safetensors"
+        items, err = downloader._validate_items(
+            [
+                {"key": "a", "url": url, "kind": "clip"},
+                {"key": "b", "url": url, "kind": "text_encoders"},
+                {"key": "c", "url": url, "kind": "vae"},
+                {"key": "c", "url": url, "kind": "vae", "filename": "x.safetensors"},
+            ]
+        )
+        self.assertEqual(err, "")
+        self.assertEqual([item["key"] for item in items], ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+import comfy_stubs
+from comfy_stubs import load_server_module
+
+fixer = load_server_module("model_fixer_routes")
+
+
+class TestScanKind(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp(prefix="mjr-models-"))
+        comfy_stubs.folder_names_and_paths["text_encoders"] = (
+            [str(self.root)],
+            {".safetensors"},
+        )
+        self.addCleanup(comfy_stubs.folder_names_and_paths.pop, "text_encoders")
+        for rel in (
+            "a.safetensors",
+            "notes.txt",
+            ".cache/b.safetensors",
+            "sub/c.safetensors",
+            ".git/d.safetensors",
+            ".mjr_tmp/job/e.safetensors",
+        ):
+            path = self.root / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x")
+
+    def scanned(self, kind):
+        return sorted(relpath for relpath, *_ in fixer._scan_kind(kind))
+
+    def test_legacy_kind_is_mapped(self):
+        expected = sorted(
+            [
+                "a.safetensors",
+                os.path.join(".cache", "b.safetensors"),
+                os.path.join("sub", "c.safetensors"),
+            ]
+        )
+        self.assertEqual(self.scanned("clip"), expected)
+        self.assertEqual(self.scanned("text_encoders"), expected)
+
+    def test_unknown_kind_yields_nothing(self):
+        self.assertEqual(self.scanned("no_such_kind"), [])
+
+
+def _entries(names):
+    entries = []
+    for name in names:
+        norm = fixer._normalize_for_match(name)
+        entries.append((name, name, norm, fixer._match_tokens(norm)))
+    return entries
+
+
+class TestCandidateShortlist(unittest.TestCase):
+    def shortlist(self, names, query):
+        base_norm = fixer._normalize_for_match(query)
+        index = fixer._CandidateIndex(_entries(names))
+        ids = index.shortlist(base_norm, fixer._match_tokens(base_norm))
+        return [names[i] for i in ids]
+
+    def test_shortlist_contents(self):
+        names = [
+            "flux1-dev-fp8.safetensors",  # shares tokens
+            "sd.safetensors",  # tokenless (stopword only)
+            "superflux1 devx.safetensors",  # contains the query, no shared token
+            "ux1 de.safetensors",  # contained in the query, no shared token
+            "wan2.1_t2v.safetensors",  # unrelated: skipped
+            "flux1-schnell.safetensors",  # shares "flux1"
+        ]
+        self.assertEqual(
+            self.shortlist(names, "flux1 dev.safetensors"),
+            [names[0], names[1], names[2], names[3], names[5]],
+        )
+
+    def test_query_without_tokens_scans_everything(self):
+        names = ["a.safetensors", "b.safetensors"]
+        self.assertEqual(self.shortlist(names, "sd.safetensors"), names)
+
+    def test_matches_pairwise_definition(self):
+        rng = random.Random(3)
+        words = ["flux1", "dev", "fp8", "sd", "xl", "vae", "x", "ab", "abc", "1"]
+
+        def name():
+            return "_".join(rng.choice(words) for _ in range(rng.randint(1, 4)))
+
+        names = [name() for _ in range(300)]
+        entries = _entries(names)
+        index = fixer._CandidateIndex(entries)
+        for _ in range(200):
+            base_norm = fixer._normalize_for_match(name())
+            base_tokens = fixer._match_tokens(base_norm)
+            if not base_tokens:
+                continue
+            expected = [
+                i
+                for i, (_r, _b, norm, tokens) in enumerate(entries)
+                if not tokens
+                or tokens & base_tokens
+                or base_norm in norm
+                or norm in base_norm
+            ]
+            self.assertEqual(list(index.shortlist(base_norm, base_tokens)), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
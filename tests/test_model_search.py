@@ -0,0 +1,53 @@
+import time
+import unittest
+from unittest import mock
+
+from comfy_stubs import load_server_module
+
+search = load_server_module("model_search_api")
+
+
+class TestMatchScore(unittest.TestCase):
+    def test_short_word_overlap_keeps_its_score(self):
+        score, level = search.calculate_match_score("ae1.0.safetensors", ".1.0.pth")
+        self.assertEqual((score, level), (60.0, "Subset match"))
+
+    def test_gated_scorer_only_rejects_scores_below_its_threshold(self):
+        query = "flux1-dev-fp8.safetensors"
+        scorer = search.make_scorer(query, min_score=80)
+        self.assertLess(search.calculate_match_score(query, "wan2.1_t2v")[0], 80.0)
+        self.assertEqual(scorer("wan2.1_t2v"), (0.0, "No match"))
+        self.assertEqual(scorer("flux1_dev_fp8")[0], 100.0)
+
+    def test_gated_scorer_keeps_short_word_subset_matches(self):
+        for query, candidate in (
+            ("sd xl vae fp16", "xl_sd.safetensors"),
+            ("abc de fg", "fg de"),
+        ):
+            expected = search.calculate_match_score(query, candidate, candidate)
+            self.assertGreaterEqual(expected[0], 85.0)
+            scorer = search.make_scorer(query, min_score=80)
+            self.assertEqual(scorer(candidate, candidate), expected)
+
+
+class TestBatchSearchCache(unittest.TestCase):
+    def setUp(self):
+        search._batch_search_cache.clear()
+        self.addCleanup(search._batch_search_cache.clear)
+
+    def cached_for(self, total_results):
+        result = {"platforms": {}, "total_results": total_results}
+        with mock.patch.object(search, "search_all_platforms", return_value=result):
+            self.assertEqual(search.search_all_platforms_batch(["q"], 1), [result])
+        expires_at, _ = search._batch_search_cache[("q", 1)]
+        return expires_at - time.time()
+
+    def test_empty_result_expires_quickly(self):
+        self.assertLessEqual(self.cached_for(0), search.HF_TREE_FAILURE_TTL)
+
+    def test_found_result_is_kept_for_full_ttl(self):
+        self.assertGreater(self.cached_for(2), search.HF_TREE_FAILURE_TTL)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import comfy_stubs
+from comfy_stubs import load_server_module
+
+routes = load_server_module("project_routes")
+
+
+def _case_insensitive_exists(path):
+    parent = path.parent
+    return parent.is_dir() and any(
+        child.name.casefold() == path.name.casefold() for child in parent.iterdir()
+    )
+
+
+class TestExistingProjectFolders(unittest.TestCase):
+    def setUp(self):
+        self.root = Path(comfy_stubs._output_dir) / "PROJECTS"
+        (self.root / "Alpha").mkdir(parents=True, exist_ok=True)
+
+    def test_exact_names_come_from_scandir(self):
+        found = routes._existing_project_folders(["Alpha", "missing"])
+        self.assertEqual(found, {"Alpha"})
+
+    def test_case_mismatch_falls_back_to_the_filesystem(self):
+        with mock.patch.object(Path, "exists", _case_insensitive_exists):
+            found = routes._existing_project_folders(["alpha", "missing"])
+        self.assertEqual(found, {"alpha"})
+
+
+if __name__ == "__main__":
+    unittest.main()